@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import enum
+import hashlib
+import itertools
+import json
+import pickle
+import sqlite3
+import warnings
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import dspy
+import pydantic
+
+# Tags prefixed to stored values, determining how values are decoded.
+_PYDANTIC_TAG = b"p"
+_DSPY_TAG = b"d"
+_PICKLE_TAG = b"b"
+# Max. number of keys per SQL query. SQLite limits the number of host parameters per statement.
+_QUERY_BATCH_SIZE = 500
+
+
+class ResultCache:
+    """Persistent cache for engine results per document chunk, backed by SQLite.
+    Allows repeated pipeline runs to skip inference for chunks that have already been processed with the same model,
+    engine configuration, inference mode, prompt signature, prompt template and few-shot examples.
+    """
+
+    def __init__(self, path: Path | str, model_id: str):
+        """
+        Initializes new ResultCache.
+        :param path: Path to SQLite database file. Created if it doesn't exist.
+        :param model_id: ID of the model producing the results, e.g. model name and revision. Engines can't identify
+            their models reliably, so this has to be provided explicitly. Only results produced with the same model ID
+            are reused.
+        """
+        self._path = Path(path)
+        self._model_id = model_id
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS results (key BLOB PRIMARY KEY, value BLOB NOT NULL)")
+
+    @property
+    def path(self) -> Path:
+        """Returns path to SQLite database file.
+        :return Path: Path to SQLite database file.
+        """
+        return self._path
+
+    @property
+    def model_id(self) -> str:
+        """Returns model ID.
+        :return str: Model ID.
+        """
+        return self._model_id
+
+    def keys(
+        self,
+        chunk_keys: Iterable[bytes],
+        engine: str,
+        inference_mode: enum.Enum,
+        prompt_signature: Any,
+        prompt_template: str | None,
+        fewshot_examples: list[dict[str, Any]],
+    ) -> list[bytes]:
+        """Computes cache keys for chunks.
+        :param chunk_keys: Keys identifying chunk values.
+        :param engine: Engine description, e.g. its serialized config.
+        :param inference_mode: Inference mode.
+        :param prompt_signature: Prompt signature.
+        :param prompt_template: Prompt template.
+        :param fewshot_examples: Few-shot examples as dicts.
+        :return list[bytes]: Cache key per chunk.
+        """
+        task_hash = hashlib.blake2b(digest_size=16)
+        for part in (
+            self._model_id,
+            engine,
+            inference_mode.name,
+            ResultCache._describe_signature(prompt_signature),
+            repr(prompt_template),
+            repr(fewshot_examples),
+        ):
+            task_hash.update(part.encode())
+            task_hash.update(b"\x00")
+
+        keys: list[bytes] = []
+        for chunk_key in chunk_keys:
+            chunk_hash = task_hash.copy()
+            chunk_hash.update(chunk_key)
+            keys.append(chunk_hash.digest())
+
+        return keys
+
+    @staticmethod
+    def _describe_signature(prompt_signature: Any) -> str:
+        """Returns string description of prompt signature, which changes whenever the signature's structure does.
+        :param prompt_signature: Prompt signature.
+        :return str: Description of prompt signature.
+        """
+        # Pydantic (and DSPy) classes are described by their JSON schema, since their repr only contains the class name.
+        if isinstance(prompt_signature, type) and issubclass(prompt_signature, pydantic.BaseModel):
+            try:
+                return json.dumps(prompt_signature.model_json_schema(), sort_keys=True, default=str)
+            except TypeError:
+                return f"{prompt_signature!r}: {prompt_signature.model_fields!r} {prompt_signature.__doc__}"
+
+        return repr(prompt_signature)
+
+    def contains(self, keys: Iterable[bytes]) -> set[bytes]:
+        """Returns those of the specified keys that have cached results.
+        :param keys: Keys to check.
+        :return set[bytes]: Keys with cached results.
+        """
+        found: set[bytes] = set()
+        keys = iter(keys)
+
+        while batch := list(itertools.islice(keys, _QUERY_BATCH_SIZE)):
+            query = f"SELECT key FROM results WHERE key IN ({','.join('?' * len(batch))})"
+            found.update(row[0] for row in self._conn.execute(query, batch))
+
+        return found
+
+    def get(self, key: bytes, prompt_signature: Any) -> Any | None:
+        """Returns cached result.
+        :param key: Cache key.
+        :param prompt_signature: Prompt signature the result was produced with. Required to restore Pydantic and DSPy
+            results.
+        :return Any | None: Cached result. None if key isn't cached.
+        """
+        row = self._conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        tag, value = row[0][:1], row[0][1:]
+        if tag == _PYDANTIC_TAG:
+            return prompt_signature.model_validate_json(value)
+        if tag == _DSPY_TAG:
+            return dspy.Prediction.from_completions(pickle.loads(value), signature=prompt_signature)
+        return pickle.loads(value)
+
+    def put(self, key: bytes, result: Any) -> None:
+        """Caches result. Results that can't be serialized aren't cached.
+        :param key: Cache key.
+        :param result: Result to cache.
+        """
+        try:
+            if isinstance(result, pydantic.BaseModel):
+                value = _PYDANTIC_TAG + result.model_dump_json().encode()
+            elif isinstance(result, dspy.Prediction):
+                value = _DSPY_TAG + pickle.dumps(dict(result.completions.items()))
+            else:
+                value = _PICKLE_TAG + pickle.dumps(result)
+        except (pickle.PicklingError, AttributeError, TypeError) as err:
+            warnings.warn(f"Result of type {type(result).__name__} can't be serialized and won't be cached: {err}")
+            return
+
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)", (key, value))
+
+    def __len__(self) -> int:
+        """Returns number of cached results.
+        :return int: Number of cached results.
+        """
+        return int(self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0])
+
+    def clear(self) -> None:
+        """Removes all cached results."""
+        with self._conn:
+            self._conn.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        """Closes connection to database."""
+        self._conn.close()
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Any
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Doc:
     """A document holding data to be processed."""
 
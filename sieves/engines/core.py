@@ -3,6 +3,7 @@ from __future__ import annotations
 import abc
 import asyncio
 import enum
+import functools
 import itertools
 import sys
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
@@ -18,6 +19,19 @@ EngineModel = TypeVar("EngineModel")
 EngineResult = TypeVar("EngineResult", covariant=True)
 EngineInferenceMode = TypeVar("EngineInferenceMode", bound=enum.Enum)
 
+# Environment for compiling prompt templates. Templates are compiled from strings and never reloaded.
+_TEMPLATE_ENV = jinja2.Environment(auto_reload=False)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_template(template: str) -> jinja2.Template:
+    """Compiles Jinja2 template. Compiled templates are cached, so repeated task runs and tasks sharing the same
+    templates don't have to parse them again.
+    :param template: Template string.
+    :return jinja2.Template: Compiled template.
+    """
+    return _TEMPLATE_ENV.from_string(template)
+
 
 class Executable(Protocol[EngineResult]):
     def __call__(self, values: Iterable[dict[str, Any]]) -> Iterable[EngineResult | None]:
@@ -158,7 +172,7 @@ class PydanticEngine(abc.ABC, Engine[EnginePromptSignature, EngineResult, Engine
         :return: Jinja2 template.
         """
         assert template, f"prompt_template has to be provided to {cls.__name__}."
-        return jinja2.Template(template)
+        return compile_template(template)
 
     @property
     def supports_few_shotting(self) -> bool:
@@ -169,17 +183,17 @@ class PydanticEngine(abc.ABC, Engine[EnginePromptSignature, EngineResult, Engine
         generator: Callable[[list[str]], Iterable[EngineResult]],
         template: jinja2.Template,
         values: Iterable[dict[str, Any]],
-        fewshot_examples: Iterable[pydantic.BaseModel],
+        fewshot_examples_dict: list[dict[str, Any]],
     ) -> Iterable[EngineResult | None]:
         """
         Runs inference record by record with exception handling for template- and Pydantic-based engines.
         :param generator: Callable generating responses.
         :param template: Prompt template.
         :param values: Doc values to inject.
-        :param fewshot_examples: Fewshot examples.
+        :param fewshot_examples_dict: Fewshot examples, as converted by `_convert_fewshot_examples()`. Engines convert
+            these once when building their executable, so that the conversion doesn't have to be repeated per call.
         :return: Results parsed from responses.
         """
-        fewshot_examples_dict = Engine._convert_fewshot_examples(fewshot_examples)
         examples = {"examples": fewshot_examples_dict} if len(fewshot_examples_dict) else {}
         batch_size = self._batch_size if self._batch_size != -1 else sys.maxsize
         # Ensure values are read as generator for standardized batch handling (otherwise we'd have to use different
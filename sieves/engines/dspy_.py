@@ -77,23 +77,23 @@ class DSPy(Engine[PromptSignature, Result, Model, InferenceMode]):
         assert isinstance(prompt_signature, type)
 
         # Note: prompt_template is ignored here, as DSPy doesn't use it directly (only prompt_signature_description).
-        def execute(values: Iterable[dict[str, Any]]) -> Iterable[Result | None]:
-            # Handled differently than the other supported modules: dspy.Module serves as both the signature as well as
-            # the inference generator.
-            if inference_mode == InferenceMode.module:
-                assert isinstance(prompt_signature, dspy.Module), ValueError(
-                    "In inference mode 'module' the provided prompt signature has to be of type dspy.Module."
-                )
-                generator = inference_mode.value(**self._init_kwargs)
-            else:
-                assert issubclass(prompt_signature, dspy.Signature)
-                generator = inference_mode.value(signature=prompt_signature, **self._init_kwargs)
-
-            # Compile predictor with few-shot examples.
-            fewshot_examples_dict = DSPy._convert_fewshot_examples(fewshot_examples)
-            examples = [dspy.Example(**fs_example) for fs_example in fewshot_examples_dict]
-            generator = dspy.asyncify(dspy.LabeledFewShot(k=5).compile(student=generator, trainset=examples))
+        # Handled differently than the other supported modules: dspy.Module serves as both the signature as well as
+        # the inference generator.
+        if inference_mode == InferenceMode.module:
+            assert isinstance(prompt_signature, dspy.Module), ValueError(
+                "In inference mode 'module' the provided prompt signature has to be of type dspy.Module."
+            )
+            generator = inference_mode.value(**self._init_kwargs)
+        else:
+            assert issubclass(prompt_signature, dspy.Signature)
+            generator = inference_mode.value(signature=prompt_signature, **self._init_kwargs)
+
+        # Compile predictor with few-shot examples.
+        fewshot_examples_dict = DSPy._convert_fewshot_examples(fewshot_examples)
+        examples = [dspy.Example(**fs_example) for fs_example in fewshot_examples_dict]
+        generator = dspy.asyncify(dspy.LabeledFewShot(k=5).compile(student=generator, trainset=examples))
 
+        def execute(values: Iterable[dict[str, Any]]) -> Iterable[Result | None]:
             batch_size = self._batch_size if self._batch_size != -1 else sys.maxsize
             # Ensure values are read as generator for standardized batch handling (otherwise we'd have to use
             # different batch handling depending on whether lists/tuples or generators are used).
@@ -6,14 +6,15 @@ from collections.abc import Iterable
 from typing import Any, TypeAlias
 
 import gliner.multitask.base
-import jinja2
 import pydantic
 
-from sieves.engines.core import Engine, Executable
+from sieves.engines.core import Engine, Executable, compile_template
+from sieves.serialization import Attribute
 
 PromptSignature: TypeAlias = list[str]
 Model: TypeAlias = gliner.model.GLiNER
-Result: TypeAlias = list[dict[str, str | float]] | str
+# Question answering yields one list of answers per question, all other inference modes one list of predictions.
+Result: TypeAlias = list[dict[str, str | float]] | list[list[dict[str, str | float]]] | str
 
 
 class InferenceMode(enum.Enum):
@@ -27,6 +28,25 @@ class InferenceMode(enum.Enum):
     relation_extraction = gliner.multitask.GLiNERRelationExtractor
 
 
+def _run_model(model: Model, texts: list[str], labels: list[str], **kwargs: Any) -> list[list[dict[str, Any]]]:
+    """Runs GliNER model on texts. GliNER's method for this has been renamed across releases (`run()`, `inference()`,
+    `batch_predict_entities()`), so we use whichever one the installed version provides.
+    :param model: GliNER model.
+    :param texts: Texts to run model on.
+    :param labels: Labels to predict.
+    :param kwargs: Inference kwargs, e.g. threshold or batch size.
+    :return list[list[dict[str, Any]]]: Predicted spans per text.
+    :raises AttributeError: If the model doesn't provide any of the supported inference methods.
+    """
+    for method_name in ("run", "inference", "batch_predict_entities"):
+        method = getattr(model, method_name, None)
+        if callable(method):
+            predictions: list[list[dict[str, Any]]] = method(texts, labels, **kwargs)
+            return predictions
+
+    raise AttributeError(f"{type(model).__name__} doesn't provide a supported inference method.")
+
+
 class GliX(Engine[PromptSignature, Result, Model, InferenceMode]):
     def __init__(
         self,
@@ -35,9 +55,37 @@ class GliX(Engine[PromptSignature, Result, Model, InferenceMode]):
         inference_kwargs: dict[str, Any] | None = None,
         strict_mode: bool = False,
         batch_size: int = -1,
+        compile_model: bool = False,
     ):
+        """
+        :param model: GliNER model.
+        :param init_kwargs: Optional kwargs to supply to engine executable at init time.
+        :param inference_kwargs: Optional kwargs to supply to engine executable at inference time.
+        :param strict_mode: If True, exception is raised if prompt response can't be parsed correctly.
+        :param batch_size: Batch size in processing prompts. -1 will batch all documents in one go.
+        :param compile_model: Whether to JIT-compile the underlying torch module with `torch.compile()`. Compilation
+            happens on the first forward pass, which is hence slower - subsequent passes are faster. Falls back to eager
+            mode if the installed torch version doesn't support this.
+        """
         super().__init__(model, init_kwargs, inference_kwargs, strict_mode, batch_size)
         self._model_wrappers: dict[InferenceMode, gliner.multitask.base.GLiNERBasePipeline] = {}
+        self._compile_model = compile_model
+        if compile_model:
+            self._compile()
+
+    def _compile(self) -> None:
+        """JIT-compiles the underlying torch module in place. Compiling in place (as opposed to wrapping the module with
+        `torch.compile()`) keeps the module's state dict unchanged, so the model can still be saved as usual.
+        """
+        try:
+            # Input lengths vary between batches, hence we compile with dynamic shapes to avoid recompilations.
+            self._model.model.compile(dynamic=True)
+        except (AttributeError, RuntimeError) as err:
+            warnings.warn(f"Compiling model failed, running model in eager mode instead: {err}")
+
+    @property
+    def _attributes(self) -> dict[str, Attribute]:
+        return {**super()._attributes, "compile_model": Attribute(value=self._compile_model)}
 
     @property
     def inference_modes(self) -> type[InferenceMode]:
@@ -67,23 +115,52 @@ class GliX(Engine[PromptSignature, Result, Model, InferenceMode]):
         # Overwrite prompt default template, if template specified. Note that this is a static prompt and GliX doesn't
         # do few-shotting, so we don't inject anything into the template.
         if prompt_template:
-            self._model.prompt = jinja2.Template(prompt_template).render()
+            self._model.prompt = compile_template(prompt_template).render()
+
+        params_per_mode: dict[InferenceMode, dict[str, Any]] = {
+            InferenceMode.classification: {"classes": prompt_signature, "multi_label": True},
+            InferenceMode.question_answering: {"questions": prompt_signature},
+            InferenceMode.summarization: {},
+        }
+        try:
+            params = params_per_mode[inference_mode]
+        except KeyError:
+            raise ValueError(f"Inference mode {inference_mode} not supported by {cls_name} engine.")
+
+        batch_size = self._batch_size if self._batch_size != -1 else sys.maxsize
+        # GliNER pipelines split their input into forward passes of 8 texts by default. If a batch size is set, we align
+        # the forward pass size with it, so that every batch is processed in a single forward pass.
+        if self._batch_size != -1:
+            # For question answering, every text is expanded into one prompt per question (see below).
+            n_prompts_per_text = len(prompt_signature) if inference_mode == InferenceMode.question_answering else 1
+            params["batch_size"] = self._batch_size * n_prompts_per_text
+        params |= self._inference_kwargs
+
+        def infer(texts: list[str]) -> Iterable[Result]:
+            """Runs model on batch of texts.
+            :param texts: Texts to run model on.
+            :return Iterable[Result]: Results per text.
+            """
+            if inference_mode != InferenceMode.question_answering:
+                yield from model(texts, **params)
+                return
+
+            # GliNER's QA pipeline asks the same question for all texts. We hence expand every text into one prompt per
+            # question, run all prompts at once and group the answers per text afterwards (one list per question).
+            questions: list[str] = params["questions"]
+            prompts = [model.prepare_texts([text], question)[0] for text in texts for question in questions]
+            run_params = {key: value for key, value in params.items() if key != "questions"}
+            labels = run_params.pop("labels", ["answer"])
+            answers = model.process_predictions(_run_model(model.model, prompts, labels, **run_params))
+
+            for i in range(0, len(answers), len(questions)):
+                yield answers[i : i + len(questions)]
 
         def execute(values: Iterable[dict[str, Any]]) -> Iterable[Result]:
             """Execute prompts with engine for given values.
             :param values: Values to inject into prompts.
             :return Iterable[Result]: Results for prompts.
             """
-            try:
-                params = {
-                    InferenceMode.classification: {"classes": prompt_signature, "multi_label": True},
-                    InferenceMode.question_answering: {"questions": prompt_signature},
-                    InferenceMode.summarization: {},
-                }[inference_mode]
-            except KeyError:
-                raise ValueError(f"Inference mode {inference_mode} not supported by {cls_name} engine.")
-
-            batch_size = self._batch_size if self._batch_size != -1 else sys.maxsize
             # Ensure values are read as generator for standardized batch handling (otherwise we'd have to use
             # different batch handling depending on whether lists/tuples or generators are used).
             values = (v for v in values)
@@ -92,7 +169,6 @@ class GliX(Engine[PromptSignature, Result, Model, InferenceMode]):
                 if len(batch) == 0:
                     break
 
-                assert isinstance(params, dict)
-                yield from model(batch, **(params | self._inference_kwargs))
+                yield from infer(batch)
 
         return execute
@@ -4,11 +4,10 @@ import sys
 from collections.abc import Iterable
 from typing import Any, TypeAlias
 
-import jinja2
 import pydantic
 import transformers
 
-from sieves.engines.core import Engine, Executable
+from sieves.engines.core import Engine, Executable, compile_template
 
 PromptSignature: TypeAlias = list[str]
 Model: TypeAlias = transformers.Pipeline
@@ -46,7 +45,7 @@ class HuggingFace(Engine[PromptSignature, Result, Model, InferenceMode]):
         # will be document-invariant.
         fewshot_examples_dict = HuggingFace._convert_fewshot_examples(fewshot_examples)
         # Render hypothesis template with everything but text.
-        template = jinja2.Template(prompt_template).render(**({"examples": fewshot_examples_dict}))
+        template = compile_template(prompt_template).render(**({"examples": fewshot_examples_dict}))
 
         def execute(values: Iterable[dict[str, Any]]) -> Iterable[Result]:
             """Execute prompts with engine for given values.
@@ -38,6 +38,7 @@ class Instructor(PydanticEngine[PromptSignature, Result, Model, InferenceMode]):
         assert isinstance(prompt_signature, type)
         cls_name = self.__class__.__name__
         template = self._create_template(prompt_template)
+        fewshot_examples_dict = self._convert_fewshot_examples(fewshot_examples)
 
         def execute(values: Iterable[dict[str, Any]]) -> Iterable[Result | None]:
             """Execute prompts with engine for given values.
@@ -64,6 +65,6 @@ class Instructor(PydanticEngine[PromptSignature, Result, Model, InferenceMode]):
                 case _:
                     raise ValueError(f"Inference mode {inference_mode} not supported by {cls_name} engine.")
 
-            yield from self._infer(generate, template, values, fewshot_examples)
+            yield from self._infer(generate, template, values, fewshot_examples_dict)
 
         return execute
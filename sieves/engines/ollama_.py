@@ -64,6 +64,9 @@ class Ollama(PydanticEngine[PromptSignature, Result, Model, InferenceMode]):
         assert isinstance(prompt_signature, type)
         cls_name = self.__class__.__name__
         template = self._create_template(prompt_template)
+        fewshot_examples_dict = self._convert_fewshot_examples(fewshot_examples)
+        # JSON schema is identical for all prompts, hence it's only generated once.
+        response_format = prompt_signature.model_json_schema()
 
         def execute(values: Iterable[dict[str, Any]]) -> Iterable[Result | None]:
             """Execute prompts with engine for given values.
@@ -81,7 +84,7 @@ class Ollama(PydanticEngine[PromptSignature, Result, Model, InferenceMode]):
                             self._client.chat(
                                 messages=[{"role": "user", "content": prompt}],
                                 model=self._model.name,
-                                format=prompt_signature.model_json_schema(),
+                                format=response_format,
                                 **self._inference_kwargs,
                             )
                             for prompt in prompts
@@ -100,6 +103,6 @@ class Ollama(PydanticEngine[PromptSignature, Result, Model, InferenceMode]):
                 case _:
                     raise ValueError(f"Inference mode {inference_mode} not supported by {cls_name} engine.")
 
-            yield from self._infer(generate, template, values, fewshot_examples)
+            yield from self._infer(generate, template, values, fewshot_examples_dict)
 
         return execute
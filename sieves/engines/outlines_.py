@@ -4,12 +4,12 @@ from typing import Any, TypeAlias
 
 import outlines
 import pydantic
-from outlines.models import MLXLM, ExLlamaV2Model, LlamaCpp, OpenAI, Transformers, TransformersVision
+from outlines.models import MLXLM, VLLM, ExLlamaV2Model, LlamaCpp, OpenAI, Transformers, TransformersVision
 
 from sieves.engines.core import Executable, PydanticEngine
 
 PromptSignature: TypeAlias = pydantic.BaseModel | list[str] | str
-Model: TypeAlias = ExLlamaV2Model | LlamaCpp | MLXLM | OpenAI | TransformersVision | Transformers
+Model: TypeAlias = ExLlamaV2Model | LlamaCpp | MLXLM | OpenAI | TransformersVision | Transformers | VLLM
 Result: TypeAlias = pydantic.BaseModel | str
 
 
@@ -30,6 +30,13 @@ class InferenceMode(enum.Enum):
 
 
 class Outlines(PydanticEngine[PromptSignature, Result, Model, InferenceMode]):
+    """Engine for Outlines.
+    Note on throughput: with a vLLM model (`outlines.models.vllm()`), all prompts passed to the model at once are
+    scheduled with vLLM's continuous batching, i.e. finished sequences are immediately replaced by waiting ones. Static
+    batches would stall on their longest output instead - so keep `batch_size=-1` for vLLM models, and use the task's
+    `batch_size` to control how many documents are submitted at once.
+    """
+
     @property
     def inference_modes(self) -> type[InferenceMode]:
         return InferenceMode
@@ -43,34 +50,38 @@ class Outlines(PydanticEngine[PromptSignature, Result, Model, InferenceMode]):
     ) -> Executable[Result | None]:
         cls_name = self.__class__.__name__
         template = self._create_template(prompt_template)
+        fewshot_examples_dict = self._convert_fewshot_examples(fewshot_examples)
+
+        # Construct generator once, so that its (potentially expensive) setup - e.g. compiling the JSON schema into a
+        # finite-state machine - is shared by all calls of this executable.
+        generator_factory: Callable[..., Any] = inference_mode.value[0]
+
+        match inference_mode:
+            case InferenceMode.text:
+                seq_generator = generator_factory(self._model, **self._init_kwargs)
+            case InferenceMode.regex:
+                assert isinstance(prompt_signature, str), ValueError(
+                    "PromptSignature has to be supplied as string in outlines regex mode."
+                )
+                seq_generator = generator_factory(self._model, regex_str=prompt_signature, **self._init_kwargs)
+            case InferenceMode.choice:
+                assert isinstance(prompt_signature, list), ValueError(
+                    f"PromptSignature has to be supplied as list of strings or enum values in {cls_name} choice "
+                    f"mode."
+                )
+                seq_generator = generator_factory(self._model, choices=prompt_signature, **self._init_kwargs)
+
+            case InferenceMode.json:
+                assert isinstance(prompt_signature, type) and issubclass(prompt_signature, pydantic.BaseModel)
+                seq_generator = generator_factory(self._model, schema_object=prompt_signature, **self._init_kwargs)
+            case _:
+                raise ValueError(f"Inference mode {inference_mode} not supported by {cls_name} engine.")
 
         def execute(values: Iterable[dict[str, Any]]) -> Iterable[Result | None]:
             """Execute prompts with engine for given values.
             :param values: Values to inject into prompts.
             :return Iterable[Result | None]: Results for prompts. Results are None if corresponding prompt failed.
             """
-            generator_factory: Callable[..., Any] = inference_mode.value[0]
-
-            match inference_mode:
-                case InferenceMode.text:
-                    seq_generator = generator_factory(self._model, **self._init_kwargs)
-                case InferenceMode.regex:
-                    assert isinstance(prompt_signature, str), ValueError(
-                        "PromptSignature has to be supplied as string in outlines regex mode."
-                    )
-                    seq_generator = generator_factory(self._model, regex_str=prompt_signature, **self._init_kwargs)
-                case InferenceMode.choice:
-                    assert isinstance(prompt_signature, list), ValueError(
-                        f"PromptSignature has to be supplied as list of strings or enum values in {cls_name} choice "
-                        f"mode."
-                    )
-                    seq_generator = generator_factory(self._model, choices=prompt_signature, **self._init_kwargs)
-
-                case InferenceMode.json:
-                    assert isinstance(prompt_signature, type) and issubclass(prompt_signature, pydantic.BaseModel)
-                    seq_generator = generator_factory(self._model, schema_object=prompt_signature, **self._init_kwargs)
-                case _:
-                    raise ValueError(f"Inference mode {inference_mode} not supported by {cls_name} engine.")
 
             def generate(prompts: list[str]) -> Iterable[Result]:
                 yield from seq_generator(prompts, **self._inference_kwargs)
@@ -79,7 +90,7 @@ class Outlines(PydanticEngine[PromptSignature, Result, Model, InferenceMode]):
                 generate,
                 template,
                 values,
-                fewshot_examples,
+                fewshot_examples_dict,
             )
 
         return execute
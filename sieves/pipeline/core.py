@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import copy
 from collections.abc import Iterable
 from pathlib import Path
@@ -58,6 +59,29 @@ class Pipeline:
 
         return processed_docs
 
+    async def acall(self, docs: Iterable[Doc], in_place: bool = False, concurrent: bool = False) -> list[Doc]:
+        """Process a list of documents through all tasks without blocking the event loop.
+
+        :param docs: Documents to process.
+        :param in_place: Whether to modify documents in-place or create copies.
+        :param concurrent: Whether to run all tasks concurrently. Only use this if tasks are independent of each other,
+            i.e. no task relies on another task's results or modifications (as is the case e.g. for chunking).
+            Otherwise tasks are run one after another.
+        :return list[Doc]: Processed documents.
+        """
+        processed_docs = list(docs) if in_place else [copy.deepcopy(doc) for doc in docs]
+
+        if concurrent:
+            logger.info(f"Running tasks {', '.join(task.id for task in self._tasks)} concurrently.")
+            await asyncio.gather(*[task.acall(processed_docs) for task in self._tasks])
+            return processed_docs
+
+        for i, task in enumerate(self._tasks):
+            logger.info(f"Running task {task.id} ({i + 1}/{len(self._tasks)} tasks).")
+            processed_docs = await task.acall(processed_docs)
+
+        return processed_docs
+
     def dump(self, path: Path | str) -> None:
         """Save pipeline config to disk.
         :param path: Target path.
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import sys
 from collections.abc import Iterable
 from typing import Any
 
@@ -19,7 +21,8 @@ class Task(abc.ABC):
         :param include_meta: Whether to include meta information generated by the task.
         """
         self._show_progress = show_progress
-        self._task_id = task_id if task_id else self.__class__.__name__
+        # Task IDs are used as keys in every document's results, hence we intern them for faster key lookups.
+        self._task_id = sys.intern(task_id if task_id else self.__class__.__name__)
         self._include_meta = include_meta
 
     @property
@@ -36,6 +39,14 @@ class Task(abc.ABC):
         :return: Processed docs.
         """
 
+    async def acall(self, docs: Iterable[Doc]) -> list[Doc]:
+        """Execute task in a worker thread, so that the event loop isn't blocked. This allows for running multiple tasks
+        with independent engines (e.g. different GPUs or APIs) concurrently.
+        :param docs: Docs to process.
+        :return: Processed docs.
+        """
+        return await asyncio.to_thread(lambda: list(self(docs)))
+
     @property
     def _state(self) -> dict[str, Any]:
         """Returns attributes to serialize.
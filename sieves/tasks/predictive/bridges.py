@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import abc
+import itertools
+import operator
 from collections import defaultdict
 from collections.abc import Iterable
 from typing import Any, Generic, TypeVar
 
+import numpy as np
+import numpy.typing as npt
+
 from sieves.data import Doc
 from sieves.engines import EngineInferenceMode, glix_
 
@@ -79,6 +84,8 @@ class Bridge(Generic[TaskPromptSignature, TaskResult, EngineInferenceMode], abc.
 
     def extract(self, docs: Iterable[Doc]) -> Iterable[dict[str, Any]]:
         """Extract all values from doc instances that are to be injected into the prompts.
+        Note that the returned dicts are owned by the calling task, which may modify them (e.g. to set "text" to a
+        document chunk). Hence a new dict has to be returned for every document.
         :param docs: Docs to extract values from.
         :return Iterable[dict[str, Any]]: All values from doc instances that are to be injected into the prompts
         """
@@ -93,14 +100,33 @@ class Bridge(Generic[TaskPromptSignature, TaskResult, EngineInferenceMode], abc.
         """
 
     @abc.abstractmethod
-    def consolidate(self, results: Iterable[TaskResult], docs_offsets: list[tuple[int, int]]) -> Iterable[TaskResult]:
+    def consolidate(self, results: Iterable[TaskResult], docs_offsets: npt.NDArray[np.int32]) -> Iterable[TaskResult]:
         """Consolidates results for document chunks into document results.
-        :param results: Results per document chunk.
-        :param docs_offsets: Chunk offsets per document. Chunks per document can be obtained with
-            results[docs_chunk_offsets[i][0]:docs_chunk_offsets[i][1]].
+        :param results: Results per document chunk. Results are produced lazily by the engine and can only be iterated
+            over once, in order. Use `_results_per_doc()` to fetch the chunk results per document.
+        :param docs_offsets: Chunk offsets per document as array of shape (n_docs, 2). docs_offsets[i] is the
+            (start, end) range of chunk results belonging to the i-th document.
         :return Iterable[_TaskResult]: Results per document.
         """
 
+    @staticmethod
+    def _results_per_doc(
+        results: Iterable[TaskResult], docs_offsets: npt.NDArray[np.int32]
+    ) -> Iterable[list[TaskResult]]:
+        """Groups chunk results by document. Results are consumed lazily, so only the chunk results of the current
+        document are kept in memory.
+        :param results: Results per document chunk.
+        :param docs_offsets: Chunk offsets per document as array of shape (n_docs, 2).
+        :return Iterable[list[TaskResult]]: Chunk results per document.
+        """
+        results = iter(results)
+
+        # Only the number of chunks per document is needed, as results are consumed in order.
+        for n_chunks in (docs_offsets[:, 1] - docs_offsets[:, 0]).tolist():
+            doc_results = list(itertools.islice(results, n_chunks))
+            assert len(doc_results) == n_chunks
+            yield doc_results
+
 
 class GliXBridge(Bridge[list[str], glix_.Result, glix_.InferenceMode]):
     def __init__(
@@ -156,25 +182,24 @@ class GliXBridge(Bridge[list[str], glix_.Result, glix_.InferenceMode]):
         for doc, result in zip(docs, results):
             if self._has_scores:
                 doc.results[self._task_id] = []
-                for res in sorted(result, key=lambda x: x["score"], reverse=True):
+                for res in sorted(result, key=operator.itemgetter("score"), reverse=True):
                     assert isinstance(res, dict)
+                    assert self._pred_attr is not None
                     doc.results[self._task_id].append((res[self._pred_attr], res["score"]))
             else:
                 doc.results[self._task_id] = result
         return docs
 
     def consolidate(
-        self, results: Iterable[glix_.Result], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[glix_.Result], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[glix_.Result]:
-        results = list(results)
-
         # Determine label scores for chunks per document.
-        for doc_offset in docs_offsets:
+        for doc_results in self._results_per_doc(results, docs_offsets):
             # Prediction key exists: this is label-score situation. Extract scores and average.
             if self._has_scores:
                 scores: dict[str, float] = defaultdict(lambda: 0)
 
-                for rec in results[doc_offset[0] : doc_offset[1]]:
+                for rec in doc_results:
                     seen_attrs: set[str] = set()
 
                     for entry in rec:
@@ -206,16 +231,12 @@ class GliXBridge(Bridge[list[str], glix_.Result, glix_.InferenceMode]):
                 else:
                     # Average score, sort by it in descending order.
                     assert self._pred_attr is not None
-                    sorted_scores: list[dict[str, str | float]] = sorted(
-                        [
-                            {self._pred_attr: attr, "score": score / (doc_offset[1] - doc_offset[0])}
-                            for attr, score in scores.items()
-                        ],
-                        key=lambda x: x["score"],
-                        reverse=True,
-                    )
+                    sorted_scores: list[dict[str, str | float]] = [
+                        {self._pred_attr: attr, "score": score / len(doc_results)}
+                        for attr, score in sorted(scores.items(), key=operator.itemgetter(1), reverse=True)
+                    ]
                     yield sorted_scores
 
             else:
-                for rec in results[doc_offset[0] : doc_offset[1]]:
+                for rec in doc_results:
                     yield rec
@@ -1,20 +1,66 @@
 import abc
+import functools
+import operator
 from collections.abc import Iterable
 from functools import cached_property
 from typing import Literal, TypeVar
 
 import dspy
-import jinja2
+import numpy as np
+import numpy.typing as npt
 import pydantic
 
 from sieves.data import Doc
 from sieves.engines import EngineInferenceMode, dspy_, huggingface_, instructor_, langchain_, ollama_, outlines_
+from sieves.engines.core import compile_template
 from sieves.tasks.predictive.bridges import Bridge
 
 _BridgePromptSignature = TypeVar("_BridgePromptSignature")
 _BridgeResult = TypeVar("_BridgeResult")
 
 
+@functools.lru_cache(maxsize=128)
+def _build_dspy_signature(labels: tuple[str, ...], signature_desc: str | None) -> type[dspy_.PromptSignature]:
+    """Builds DSPy signature for classification. Cached, as identical labels and descriptions yield identical
+    signatures - so tasks sharing those don't have to recreate them.
+    :param labels: Labels to classify.
+    :param signature_desc: Prompt signature description.
+    :return type[dspy_.PromptSignature]: DSPy signature for classification.
+    """
+    # Dynamically create Literal as output type.
+    LabelType = Literal[*labels]  # type: ignore[valid-type]
+
+    class TextClassification(dspy.Signature):  # type: ignore[misc]
+        text: str = dspy.InputField(description="Text to classify.")
+        confidence_per_label: dict[LabelType, float] = dspy.OutputField(
+            description="Confidence per label that text should be classified with this label."
+        )
+
+    TextClassification.__doc__ = compile_template(signature_desc).render()
+
+    return TextClassification
+
+
+@functools.lru_cache(maxsize=128)
+def _build_pydantic_signature(labels: tuple[str, ...], signature_desc: str | None) -> type[pydantic.BaseModel]:
+    """Builds Pydantic signature for classification. Cached, as identical labels and descriptions yield identical
+    signatures - so tasks sharing those don't have to recreate them.
+    :param labels: Labels to classify.
+    :param signature_desc: Prompt signature description.
+    :return type[pydantic.BaseModel]: Pydantic signature for classification.
+    """
+    prompt_sig = pydantic.create_model(  # type: ignore[call-overload]
+        "MultilabelPrediction",
+        __base__=pydantic.BaseModel,
+        __doc__=compile_template(signature_desc).render() if signature_desc else None,
+        reasoning=(str, ...),
+        **{label: (float, ...) for label in labels},
+    )
+
+    assert isinstance(prompt_sig, type) and issubclass(prompt_sig, pydantic.BaseModel)
+    return prompt_sig
+
+
 class ClassificationBridge(Bridge[_BridgePromptSignature, _BridgeResult, EngineInferenceMode], abc.ABC):
     def __init__(self, task_id: str, prompt_template: str | None, prompt_signature_desc: str | None, labels: list[str]):
         """
@@ -31,6 +77,8 @@ class ClassificationBridge(Bridge[_BridgePromptSignature, _BridgeResult, EngineI
             overwrite=False,
         )
         self._labels = labels
+        # Column index per label in score matrices.
+        self._label_to_idx = {label: i for i, label in enumerate(labels)}
 
 
 class DSPyClassification(ClassificationBridge[dspy_.PromptSignature, dspy_.Result, dspy_.InferenceMode]):
@@ -50,19 +98,7 @@ class DSPyClassification(ClassificationBridge[dspy_.PromptSignature, dspy_.Resul
 
     @cached_property
     def prompt_signature(self) -> type[dspy_.PromptSignature]:
-        labels = self._labels
-        # Dynamically create Literal as output type.
-        LabelType = Literal[*labels]  # type: ignore[valid-type]
-
-        class TextClassification(dspy.Signature):  # type: ignore[misc]
-            text: str = dspy.InputField(description="Text to classify.")
-            confidence_per_label: dict[LabelType, float] = dspy.OutputField(
-                description="Confidence per label that text should be classified with this label."
-            )
-
-        TextClassification.__doc__ = jinja2.Template(self.prompt_signature_description).render()
-
-        return TextClassification
+        return _build_dspy_signature(tuple(self._labels), self.prompt_signature_description)
 
     @property
     def inference_mode(self) -> dspy_.InferenceMode:
@@ -72,44 +108,35 @@ class DSPyClassification(ClassificationBridge[dspy_.PromptSignature, dspy_.Resul
         for doc, result in zip(docs, results):
             assert len(result.completions.confidence_per_label) == 1
             sorted_preds = sorted(
-                [(label, score) for label, score in result.completions.confidence_per_label[0].items()],
-                key=lambda x: x[1],
-                reverse=True,
+                result.completions.confidence_per_label[0].items(), key=operator.itemgetter(1), reverse=True
             )
             doc.results[self._task_id] = sorted_preds
         return docs
 
     def consolidate(
-        self, results: Iterable[dspy_.Result], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[dspy_.Result], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[dspy_.Result]:
-        results = list(results)
-
         # Determine label scores for chunks per document.
-        for doc_offset in docs_offsets:
-            label_scores: dict[str, float] = {label: 0.0 for label in self._labels}
-            doc_results = results[doc_offset[0] : doc_offset[1]]
+        for doc_results in self._results_per_doc(results, docs_offsets):
+            scores = np.zeros((len(doc_results), len(self._labels)), dtype=np.float64)
 
-            for res in doc_results:
+            for i, res in enumerate(doc_results):
                 assert len(res.completions.confidence_per_label) == 1
                 for label, score in res.completions.confidence_per_label[0].items():
-                    # Clamp score to range between 0 and 1. Alternatively we could force this in the prompt signature,
-                    # but this fails occasionally with some models and feels too strict (maybe a strict mode would be
-                    # useful?).
-                    label_scores[label] += max(0, min(score, 1))
-
-            sorted_label_scores: list[dict[str, str | float]] = sorted(
-                [
-                    {"label": label, "score": score / (doc_offset[1] - doc_offset[0])}
-                    for label, score in label_scores.items()
-                ],
-                key=lambda x: x["score"],
-                reverse=True,
-            )
+                    scores[i, self._label_to_idx[label]] = score
+
+            # Clamp scores to range between 0 and 1. Alternatively we could force this in the prompt signature, but
+            # this fails occasionally with some models and feels too strict (maybe a strict mode would be useful?).
+            np.clip(scores, 0, 1, out=scores)
+            # Average scores, sort labels by them in descending order.
+            mean_scores = scores.mean(axis=0)
+            sorted_idx = np.argsort(-mean_scores, kind="stable")
+            sorted_labels = [self._labels[i] for i in sorted_idx.tolist()]
 
             yield dspy.Prediction.from_completions(
                 {
-                    "confidence_per_label": [{sls["label"]: sls["score"] for sls in sorted_label_scores}],
-                    "reasoning": [str([res.reasoning for res in doc_results])],
+                    "confidence_per_label": [dict(zip(sorted_labels, mean_scores[sorted_idx].tolist()))],
+                    "reasoning": [" | ".join(res.reasoning for res in doc_results)],
                 },
                 signature=self.prompt_signature,
             )
@@ -148,36 +175,28 @@ class HuggingFaceClassification(ClassificationBridge[list[str], huggingface_.Res
 
     def integrate(self, results: Iterable[huggingface_.Result], docs: Iterable[Doc]) -> Iterable[Doc]:
         for doc, result in zip(docs, results):
-            doc.results[self._task_id] = [(label, score) for label, score in zip(result["labels"], result["scores"])]
+            doc.results[self._task_id] = list(zip(result["labels"], result["scores"]))
         return docs
 
     def consolidate(
-        self, results: Iterable[huggingface_.Result], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[huggingface_.Result], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[huggingface_.Result]:
-        results = list(results)
-
         # Determine label scores for chunks per document.
-        for doc_offset in docs_offsets:
-            label_scores: dict[str, float] = {label: 0.0 for label in self._labels}
+        for doc_results in self._results_per_doc(results, docs_offsets):
+            scores = np.zeros((len(doc_results), len(self._labels)), dtype=np.float64)
 
-            for rec in results[doc_offset[0] : doc_offset[1]]:
+            for i, rec in enumerate(doc_results):
                 for label, score in zip(rec["labels"], rec["scores"]):
                     assert isinstance(label, str)
                     assert isinstance(score, float)
-                    label_scores[label] += score
+                    scores[i, self._label_to_idx[label]] = score
 
             # Average score, sort by it in descending order.
-            sorted_label_scores: list[dict[str, str | float]] = sorted(
-                [
-                    {"label": label, "score": score / (doc_offset[1] - doc_offset[0])}
-                    for label, score in label_scores.items()
-                ],
-                key=lambda x: x["score"],
-                reverse=True,
-            )
+            mean_scores = scores.mean(axis=0)
+            sorted_idx = np.argsort(-mean_scores, kind="stable")
             yield {
-                "labels": [rec["label"] for rec in sorted_label_scores],  # type: ignore[dict-item]
-                "scores": [rec["score"] for rec in sorted_label_scores],  # type: ignore[dict-item]
+                "labels": [self._labels[i] for i in sorted_idx.tolist()],
+                "scores": mean_scores[sorted_idx].tolist(),
             }
 
 
@@ -222,50 +241,36 @@ class PydanticBasedClassification(
 
     @cached_property
     def prompt_signature(self) -> type[pydantic.BaseModel]:
-        prompt_sig = pydantic.create_model(  # type: ignore[call-overload]
-            "MultilabelPrediction",
-            __base__=pydantic.BaseModel,
-            reasoning=(str, ...),
-            **{label: (float, ...) for label in self._labels},
-        )
-
-        if self.prompt_signature_description:
-            prompt_sig.__doc__ = jinja2.Template(self.prompt_signature_description).render()
-
-        assert isinstance(prompt_sig, type) and issubclass(prompt_sig, pydantic.BaseModel)
-        return prompt_sig
+        return _build_pydantic_signature(tuple(self._labels), self.prompt_signature_description)
 
     def integrate(self, results: Iterable[pydantic.BaseModel], docs: Iterable[Doc]) -> Iterable[Doc]:
         for doc, result in zip(docs, results):
-            label_scores = {k: v for k, v in result.model_dump().items() if k != "reasoning"}
-            doc.results[self._task_id] = sorted(
-                [(label, score) for label, score in label_scores.items()], key=lambda x: x[1], reverse=True
-            )
+            # Read label scores directly from result attributes instead of serializing the whole result object.
+            label_scores = [(label, getattr(result, label)) for label in self._labels]
+            doc.results[self._task_id] = sorted(label_scores, key=operator.itemgetter(1), reverse=True)
         return docs
 
     def consolidate(
-        self, results: Iterable[pydantic.BaseModel], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[pydantic.BaseModel], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[pydantic.BaseModel]:
-        results = list(results)
-
         # Determine label scores for chunks per document.
-        reasonings: list[str] = []
-        for doc_offset in docs_offsets:
-            label_scores: dict[str, float] = {label: 0.0 for label in self._labels}
-            doc_results = results[doc_offset[0] : doc_offset[1]]
+        for doc_results in self._results_per_doc(results, docs_offsets):
+            scores = np.zeros((len(doc_results), len(self._labels)), dtype=np.float64)
 
-            for rec in doc_results:
+            reasonings: list[str] = []
+            for i, rec in enumerate(doc_results):
                 assert hasattr(rec, "reasoning")
                 reasonings.append(rec.reasoning)
-                for label in self._labels:
-                    # Clamp score to range between 0 and 1. Alternatively we could force this in the prompt signature,
-                    # but this fails occasionally with some models and feels too strict (maybe a strict mode would be
-                    # useful?).
-                    label_scores[label] += max(0, min(getattr(rec, label), 1))
+                scores[i] = [getattr(rec, label) for label in self._labels]
+
+            # Clamp scores to range between 0 and 1. Alternatively we could force this in the prompt signature, but
+            # this fails occasionally with some models and feels too strict (maybe a strict mode would be useful?).
+            np.clip(scores, 0, 1, out=scores)
+            mean_scores = scores.mean(axis=0).tolist()
 
             yield self.prompt_signature(
-                reasoning=str(reasonings),
-                **{label: score / (doc_offset[1] - doc_offset[0]) for label, score in label_scores.items()},
+                reasoning=" | ".join(reasonings),
+                **{label: score for label, score in zip(self._labels, mean_scores)},
             )
 
 
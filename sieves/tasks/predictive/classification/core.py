@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import Any, TypeAlias
+from functools import cached_property
+from typing import Any, ClassVar, TypeAlias
 
 import datasets
 import pydantic
 
+from sieves.cache import ResultCache
 from sieves.data import Doc
 from sieves.engines import Engine, EngineType, dspy_, glix_, huggingface_
 from sieves.engines.core import EngineInferenceMode, EngineModel, EnginePromptSignature, EngineResult
@@ -47,6 +49,17 @@ class FewshotExample(pydantic.BaseModel):
 
 
 class Classification(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge]):
+    # Bridge types per supported engine type. Engine types whose bridges have to be initialized differently (GliX) are
+    # handled separately in _init_bridge().
+    _BRIDGE_TYPES: ClassVar[dict[EngineType, type[_TaskBridge]]] = {
+        EngineType.dspy: DSPyClassification,
+        EngineType.instructor: InstructorClassification,
+        EngineType.huggingface: HuggingFaceClassification,
+        EngineType.outlines: OutlinesClassification,
+        EngineType.ollama: OllamaClassification,
+        EngineType.langchain: LangChainClassification,
+    }
+
     def __init__(
         self,
         labels: list[str],
@@ -57,6 +70,9 @@ class Classification(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBrid
         prompt_template: str | None = None,
         prompt_signature_desc: str | None = None,
         fewshot_examples: Iterable[FewshotExample] = (),
+        enable_chunk_cache: bool = True,
+        cache: ResultCache | None = None,
+        batch_size: int = 256,
     ) -> None:
         """
         Initializes new PredictiveTask.
@@ -67,6 +83,11 @@ class Classification(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBrid
         :param prompt_template: Custom prompt template. If None, task's default template is being used.
         :param prompt_signature_desc: Custom prompt signature description. If None, default will be used.
         :param fewshot_examples: Few-shot examples.
+        :param enable_chunk_cache: Whether to run inference only once for identical chunks. Disable if the engine
+            should produce independent results for identical chunks.
+        :param cache: Persistent cache for chunk results. If set, results are reused across runs and only chunks
+            without cached results are run through the engine.
+        :param batch_size: Number of documents processed at once. -1 will process all documents in one go.
         """
         self._labels = labels
         super().__init__(
@@ -78,6 +99,9 @@ class Classification(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBrid
             prompt_template=prompt_template,
             prompt_signature_desc=prompt_signature_desc,
             fewshot_examples=fewshot_examples,
+            enable_chunk_cache=enable_chunk_cache,
+            cache=cache,
+            batch_size=batch_size,
         )
         self._fewshot_examples: Iterable[FewshotExample]
 
@@ -97,17 +121,8 @@ class Classification(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBrid
                 label_whitelist=tuple(self._labels),
             )
 
-        bridge_types: dict[EngineType, type[_TaskBridge]] = {
-            EngineType.dspy: DSPyClassification,
-            EngineType.instructor: InstructorClassification,
-            EngineType.huggingface: HuggingFaceClassification,
-            EngineType.outlines: OutlinesClassification,
-            EngineType.ollama: OllamaClassification,
-            EngineType.langchain: LangChainClassification,
-        }
-
         try:
-            bridge_type = bridge_types[engine_type]
+            bridge_type = self._BRIDGE_TYPES[engine_type]
             assert not issubclass(bridge_type, GliXBridge)
 
             return bridge_type(
@@ -119,7 +134,7 @@ class Classification(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBrid
         except KeyError as err:
             raise KeyError(f"Engine type {engine_type} is not supported by {self.__class__.__name__}.") from err
 
-    @property
+    @cached_property
     def supports(self) -> set[EngineType]:
         return {
             EngineType.dspy,
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 import abc
+import collections
 import enum
+import functools
+import hashlib
+import itertools
+import sys
 from collections.abc import Iterable
-from typing import Any, Generic
+from typing import Any, Generic, cast
 
 import datasets
+import numpy as np
+import pyarrow as pa
 import pydantic
 
+from sieves.cache import ResultCache
 from sieves.data import Doc
 from sieves.engines import (
     Engine,
@@ -17,16 +25,23 @@ from sieves.engines import (
     EngineResult,
     EngineType,
 )
+from sieves.engines.core import Executable
 from sieves.serialization import Config, Serializable
 from sieves.tasks.core import Task
 from sieves.tasks.predictive.bridges import TaskBridge, TaskPromptSignature, TaskResult
 
+# Sentinel for exhausted result iterators. Results themselves may be None, so None can't be used for this.
+_NO_RESULT = object()
+
 
 class PredictiveTask(
     Generic[TaskPromptSignature, TaskResult, TaskBridge],
     Task,
     abc.ABC,
 ):
+    # Number of documents converted into one Arrow record batch at a time in to_dataset().
+    _DATASET_BATCH_SIZE = 10_000
+
     def __init__(
         self,
         engine: Engine[EnginePromptSignature, EngineResult, EngineModel, EngineInferenceMode],
@@ -37,6 +52,9 @@ class PredictiveTask(
         prompt_template: str | None,
         prompt_signature_desc: str | None,
         fewshot_examples: Iterable[pydantic.BaseModel],
+        enable_chunk_cache: bool,
+        cache: ResultCache | None,
+        batch_size: int,
     ):
         """
         Initializes new PredictiveTask.
@@ -49,6 +67,12 @@ class PredictiveTask(
         :param prompt_template: Custom prompt template. If None, default template is being used.
         :param prompt_signature_desc: Custom prompt signature description. If None, default will be used.
         :param fewshot_examples: Few-shot examples.
+        :param enable_chunk_cache: Whether to run inference only once for identical chunks. Disable if the engine
+            should produce independent results for identical chunks.
+        :param cache: Persistent cache for chunk results. If set, results are reused across runs and only chunks without
+            cached results are run through the engine.
+        :param batch_size: Number of documents processed at once. Documents are yielded batch by batch, so only one
+            batch is kept in memory at a time. -1 will process all documents in one go.
         """
         super().__init__(task_id=task_id, show_progress=show_progress, include_meta=include_meta)
         self._engine = engine
@@ -57,6 +81,9 @@ class PredictiveTask(
         self._custom_prompt_signature_desc = prompt_signature_desc
         self._bridge = self._init_bridge(EngineType.get_engine_type(self._engine))
         self._fewshot_examples = fewshot_examples
+        self._enable_chunk_cache = enable_chunk_cache
+        self._cache = cache
+        self._batch_size = batch_size
 
         self._validate_fewshot_examples()
 
@@ -98,6 +125,32 @@ class PredictiveTask(
         assert sig_desc is None or isinstance(sig_desc, str)
         return sig_desc
 
+    @functools.cached_property
+    def _executable(self) -> Executable[TaskResult | None]:
+        """Builds executable. The executable is built once and reused across calls, as building it can be expensive
+        for some engines (e.g. compiling a JSON schema into a finite-state machine with Outlines). Delete this attribute
+        to enforce rebuilding the executable on the next call.
+        :return Executable[TaskResult | None]: Executable.
+        """
+        assert isinstance(self._bridge.inference_mode, enum.Enum)
+        executable = self._engine.build_executable(
+            inference_mode=self._bridge.inference_mode,
+            prompt_template=self.prompt_template,
+            prompt_signature=self._bridge.prompt_signature,
+            fewshot_examples=self._fewshot_examples,
+        )
+        # The engine's result type is one of the task's result types, which can't be expressed with TypeVars (see
+        # __call__()).
+        return cast(Executable[TaskResult | None], executable)
+
+    @functools.cached_property
+    def _fewshot_examples_dict(self) -> list[dict[str, Any]]:
+        """Returns few-shot examples converted to dicts. Converted once, as they are needed for every batch of docs
+        when using a persistent cache.
+        :return list[dict[str, Any]]: Few-shot examples as dicts.
+        """
+        return Engine._convert_fewshot_examples(self._fewshot_examples)
+
     def __call__(self, docs: Iterable[Doc]) -> Iterable[Doc]:
         """Execute the task on a set of documents.
 
@@ -110,44 +163,191 @@ class PredictiveTask(
         :param docs: Documents to process.
         :return Iterable[Doc]: Processed documents.
         """
-        docs = list(docs)
-
         # 1. Compile expected prompt signatures.
         signature = self._bridge.prompt_signature
 
-        # 2. Build executable.
-        assert isinstance(self._bridge.inference_mode, enum.Enum)
-        executable = self._engine.build_executable(
-            inference_mode=self._bridge.inference_mode,
-            prompt_template=self.prompt_template,
-            prompt_signature=signature,
-            fewshot_examples=self._fewshot_examples,
-        )
+        # 2. Build executable (or reuse the one built in a previous call).
+        executable = self._executable
+
+        # Process docs in batches, so that only one batch of docs and their results has to be kept in memory at a time.
+        batch_size = self._batch_size if self._batch_size != -1 else sys.maxsize
+        docs = iter(docs)
+        while docs_batch := list(itertools.islice(docs, batch_size)):
+            yield from self._process_batch(docs_batch, executable, signature)
 
+    def _process_batch(
+        self, docs: list[Doc], executable: Executable[TaskResult | None], signature: Any
+    ) -> Iterable[Doc]:
+        """Runs executable on batch of documents and integrates the results.
+        :param docs: Batch of documents to process.
+        :param executable: Executable to run.
+        :param signature: Prompt signature.
+        :return Iterable[Doc]: Processed documents.
+        """
         # 3. Extract values from docs to inject/render those into prompt templates.
-        docs_values = self._bridge.extract(docs)
+        docs_values = list(self._bridge.extract(docs))
 
-        # 4. Map extracted docs values onto chunks.
-        docs_chunks_offsets: list[tuple[int, int]] = []
-        docs_chunks_values: list[dict[str, Any]] = []
-        for doc, doc_values in zip(docs, docs_values):
+        # 4. Map extracted docs values onto chunks. Chunk values are generated lazily, so they are only materialized
+        # once the engine consumes them.
+        docs_n_chunks = np.empty(len(docs), dtype=np.int32)
+        docs_chunks_keys: list[bytes] = []
+        for i, (doc, doc_values) in enumerate(zip(docs, docs_values)):
             assert doc.text
-            doc_chunks_values = [doc_values | {"text": chunk} for chunk in (doc.chunks or [doc.text])]
-            docs_chunks_offsets.append((len(docs_chunks_values), len(docs_chunks_values) + len(doc_chunks_values)))
-            docs_chunks_values.extend(doc_chunks_values)
+            doc_chunks = doc.chunks or [doc.text]
+            docs_n_chunks[i] = len(doc_chunks)
+            if self._enable_chunk_cache or self._cache is not None:
+                docs_chunks_keys.extend(self._chunk_keys(doc_values, doc_chunks))
 
-        # 5. Execute prompts per chunk.
-        results = list(executable(docs_chunks_values))
-        assert len(results) == len(docs_chunks_values)
+        # Chunk offsets per document as (n_docs, 2) array of start and end indices.
+        docs_chunks_ends = np.cumsum(docs_n_chunks, dtype=np.int32)
+        docs_chunks_offsets = np.stack((docs_chunks_ends - docs_n_chunks, docs_chunks_ends), axis=1)
 
-        # 6. Consolidate chunk results.
-        results = list(self._bridge.consolidate(results, docs_chunks_offsets))
-        assert len(results) == len(docs)
+        docs_chunks_values = self._chunks_values(docs, docs_values)
+
+        # 5. Execute prompts per chunk. Results are yielded as the engine produces them.
+        if self._cache is not None:
+            results = self._execute_cached(executable, docs_chunks_values, docs_chunks_keys, signature)
+        elif self._enable_chunk_cache:
+            results = self._execute_unique(executable, docs_chunks_values, docs_chunks_keys)
+        else:
+            results = self._check_n_results(executable(docs_chunks_values), int(docs_n_chunks.sum()))
+
+        # 6. Consolidate chunk results. Documents are consolidated as soon as the results for all their chunks are
+        # available, so chunk results don't have to be kept in memory for the whole set of documents.
+        consolidated_results = self._bridge.consolidate(results, docs_chunks_offsets)
 
         # 7. Integrate results into docs.
-        docs = self._bridge.integrate(results, docs)
+        return self._bridge.integrate(consolidated_results, docs)
+
+    @staticmethod
+    def _chunks_values(docs: Iterable[Doc], docs_values: Iterable[dict[str, Any]]) -> Iterable[dict[str, Any]]:
+        """Maps extracted document values onto chunks.
+        Values of documents with a single chunk are reused as they are, so only documents with multiple chunks require
+        new dicts per chunk.
+        :param docs: Documents.
+        :param docs_values: Values extracted per document. These are owned by the task and modified in place.
+        :return Iterable[dict[str, Any]]: Values per chunk.
+        """
+        for doc, doc_values in zip(docs, docs_values):
+            assert doc.text
+            chunks = doc.chunks or [doc.text]
+            if len(chunks) == 1:
+                doc_values["text"] = chunks[0]
+                yield doc_values
+            else:
+                for chunk in chunks:
+                    yield {**doc_values, "text": chunk}
+
+    @staticmethod
+    def _chunk_keys(doc_values: dict[str, Any], chunks: Iterable[str]) -> Iterable[bytes]:
+        """Computes keys identifying chunk values. Identical keys imply identical prompt values.
+        :param doc_values: Values extracted from document.
+        :param chunks: Document chunks.
+        :return Iterable[bytes]: Key per chunk.
+        """
+        # "text" is replaced by the chunk text, hence we don't include the full document text in the key.
+        doc_hash = hashlib.blake2b(repr({k: v for k, v in doc_values.items() if k != "text"}).encode(), digest_size=16)
+        for chunk in chunks:
+            chunk_hash = doc_hash.copy()
+            chunk_hash.update(chunk.encode())
+            yield chunk_hash.digest()
+
+    @staticmethod
+    def _execute_unique(
+        executable: Executable[TaskResult | None], values: Iterable[dict[str, Any]], keys: list[bytes]
+    ) -> Iterable[TaskResult | None]:
+        """Executes prompts only for chunks with unique keys and fans results out to all chunks sharing a key.
+        Results are only kept in memory until the last chunk with the corresponding key has been processed.
+        :param executable: Executable to run.
+        :param values: Values per chunk.
+        :param keys: Key per chunk, as computed by `_chunk_keys()`.
+        :return Iterable[TaskResult | None]: Results per chunk.
+        """
+        seen_keys: set[bytes] = set()
 
-        return docs
+        def unique_values() -> Iterable[dict[str, Any]]:
+            for key, chunk_values in zip(keys, values):
+                if key not in seen_keys:
+                    seen_keys.add(key)
+                    yield chunk_values
+
+        remaining = collections.Counter(keys)
+        unique_results = iter(PredictiveTask._check_n_results(executable(unique_values()), len(remaining)))
+        cached_results: dict[bytes, TaskResult | None] = {}
+
+        for key in keys:
+            result = cached_results[key] if key in cached_results else next(unique_results)
+            remaining[key] -= 1
+            if remaining[key]:
+                cached_results[key] = result
+            else:
+                cached_results.pop(key, None)
+            yield result
+
+    @staticmethod
+    def _check_n_results(results: Iterable[TaskResult | None], n_expected: int) -> Iterable[TaskResult | None]:
+        """Passes results through while ensuring that the executable produced exactly one result per prompt. The count
+        is checked as results are streamed: missing results fail once the executable is exhausted, surplus results fail
+        once the last expected result has been produced.
+        :param results: Results produced by executable.
+        :param n_expected: Number of prompts the executable was run on.
+        :return Iterable[TaskResult | None]: Results.
+        """
+        results = iter(results)
+        n_results = 0
+
+        for result in itertools.islice(results, n_expected):
+            n_results += 1
+            # Check for surplus results before yielding the last expected one, as consumers stop pulling afterwards.
+            if n_results == n_expected:
+                assert next(results, _NO_RESULT) is _NO_RESULT, f"Executable produced more than {n_expected} results."
+            yield result
+
+        assert n_results == n_expected, f"Executable produced {n_results} results instead of {n_expected}."
+
+    def _execute_cached(
+        self,
+        executable: Executable[TaskResult | None],
+        values: Iterable[dict[str, Any]],
+        keys: list[bytes],
+        signature: Any,
+    ) -> Iterable[TaskResult | None]:
+        """Executes prompts only for chunks without results in the persistent cache. Fresh results are written to the
+        cache as they are produced.
+        :param executable: Executable to run.
+        :param values: Values per chunk.
+        :param keys: Key per chunk, as computed by `_chunk_keys()`.
+        :param signature: Prompt signature.
+        :return Iterable[TaskResult | None]: Results per chunk.
+        """
+        assert self._cache is not None
+        assert isinstance(self._bridge.inference_mode, enum.Enum)
+        cache_keys = self._cache.keys(
+            keys,
+            engine=repr(self._engine.serialize().model_dump()),
+            inference_mode=self._bridge.inference_mode,
+            prompt_signature=signature,
+            prompt_template=self.prompt_template,
+            fewshot_examples=self._fewshot_examples_dict,
+        )
+        cached_keys = self._cache.contains(cache_keys)
+
+        missing_keys = [key for key in cache_keys if key not in cached_keys]
+        missing_values = (chunk_values for key, chunk_values in zip(cache_keys, values) if key not in cached_keys)
+        if self._enable_chunk_cache:
+            missing_results = iter(self._execute_unique(executable, missing_values, missing_keys))
+        else:
+            missing_results = iter(self._check_n_results(executable(missing_values), len(missing_keys)))
+
+        for key in cache_keys:
+            if key in cached_keys:
+                yield self._cache.get(key, signature)
+            else:
+                result = next(missing_results)
+                # Failed inference yields None results, which we don't want to persist.
+                if result is not None:
+                    self._cache.put(key, result)
+                yield result
 
     @property
     def _state(self) -> dict[str, Any]:
@@ -157,6 +357,9 @@ class PredictiveTask(
             "prompt_template": self._custom_prompt_template,
             "prompt_signature_desc": self._custom_prompt_signature_desc,
             "fewshot_examples": self._fewshot_examples,
+            "enable_chunk_cache": self._enable_chunk_cache,
+            "cache": self._cache,
+            "batch_size": self._batch_size,
         }
 
     @classmethod
@@ -180,6 +383,33 @@ class PredictiveTask(
         engine_param: dict[str, Any] = {"engine": engine_cls.deserialize(engine_config, **kwargs["engine"])}
         return cls(**config.to_init_dict(cls, **(kwargs | engine_param)))
 
+    def _results_to_dataset(
+        self, docs: Iterable[Doc], results_col: str, features: datasets.Features, info: datasets.DatasetInfo
+    ) -> datasets.Dataset:
+        """Creates dataset with document texts and this task's results as columns "text" and `results_col`. Documents
+        are converted to Arrow record batches in chunks, so only one chunk of rows is kept as Python objects at a time.
+        :param docs: Documents to convert.
+        :param results_col: Name of column containing task results.
+        :param features: Dataset features. Have to consist of "text" and `results_col`.
+        :param info: Dataset info.
+        :return datasets.Dataset: Created dataset.
+        :raises KeyError: If not all documents have results for this task.
+        """
+        schema = features.arrow_schema
+        record_batches: list[pa.RecordBatch] = []
+        docs = iter(docs)
+
+        while docs_batch := list(itertools.islice(docs, self._DATASET_BATCH_SIZE)):
+            try:
+                results = [doc.results[self._task_id] for doc in docs_batch]
+            except KeyError as err:
+                raise KeyError(f"Not all documents have results for this task with ID {self._task_id}") from err
+            record_batches.append(
+                pa.RecordBatch.from_pydict({"text": [doc.text for doc in docs_batch], results_col: results}, schema)
+            )
+
+        return datasets.Dataset(pa.Table.from_batches(record_batches, schema=schema), info=info)
+
     @abc.abstractmethod
     def to_dataset(self, docs: Iterable[Doc]) -> datasets.Dataset:
         """Creates Hugging Face datasets.Dataset from docs.
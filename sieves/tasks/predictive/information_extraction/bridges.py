@@ -1,14 +1,17 @@
 import abc
+import operator
 from collections.abc import Iterable
 from functools import cached_property
 from typing import TypeVar
 
 import dspy
-import jinja2
+import numpy as np
+import numpy.typing as npt
 import pydantic
 
 from sieves.data import Doc
 from sieves.engines import EngineInferenceMode, dspy_, instructor_, langchain_, ollama_, outlines_
+from sieves.engines.core import compile_template
 from sieves.tasks.predictive.bridges import Bridge
 
 _BridgePromptSignature = TypeVar("_BridgePromptSignature")
@@ -59,7 +62,7 @@ class DSPyInformationExtraction(InformationExtractionBridge[dspy_.PromptSignatur
             text: str = dspy.InputField(description="Text to extract entities from.")
             entities: list[extraction_type] = dspy.OutputField(description="Entities to extract from text.")  # type: ignore[valid-type]
 
-        Entities.__doc__ = jinja2.Template(self.prompt_signature_description).render()
+        Entities.__doc__ = compile_template(self.prompt_signature_description).render()
 
         return Entities
 
@@ -74,19 +77,18 @@ class DSPyInformationExtraction(InformationExtractionBridge[dspy_.PromptSignatur
         return docs
 
     def consolidate(
-        self, results: Iterable[dspy_.Result], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[dspy_.Result], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[dspy_.Result]:
-        results = list(results)
         entity_type = self._entity_type
         entity_type_is_frozen = entity_type.model_config.get("frozen", False)
 
         # Merge all found entities.
-        for doc_offset in docs_offsets:
+        for doc_results in self._results_per_doc(results, docs_offsets):
             reasonings: list[str] = []
             entities: list[entity_type] = []  # type: ignore[valid-type]
             seen_entities: set[entity_type] = set()  # type: ignore[valid-type]
 
-            for res in results[doc_offset[0] : doc_offset[1]]:
+            for res in doc_results:
                 if res is None:
                     continue
                 reasonings.append(res.reasoning)
@@ -145,30 +147,29 @@ class PydanticBasedInformationExtraction(
             entities: list[entity_type]  # type: ignore[valid-type]
 
         if self.prompt_signature_description:
-            Entity.__doc__ = jinja2.Template(self.prompt_signature_description).render()
+            Entity.__doc__ = compile_template(self.prompt_signature_description).render()
 
         return Entity
 
     def integrate(self, results: Iterable[pydantic.BaseModel], docs: Iterable[Doc]) -> Iterable[Doc]:
-        for doc, result in zip(docs, results):
-            assert hasattr(result, "entities")
-            doc.results[self._task_id] = result.entities
+        task_id = self._task_id
+        for doc, entities in zip(docs, map(operator.attrgetter("entities"), results)):
+            doc.results[task_id] = entities
         return docs
 
     def consolidate(
-        self, results: Iterable[pydantic.BaseModel], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[pydantic.BaseModel], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[pydantic.BaseModel]:
-        results = list(results)
         entity_type = self._entity_type
         entity_type_is_frozen = entity_type.model_config.get("frozen", False)
 
         # Determine label scores for chunks per document.
-        for doc_offset in docs_offsets:
+        for doc_results in self._results_per_doc(results, docs_offsets):
             reasonings: list[str] = []
             entities: list[entity_type] = []  # type: ignore[valid-type]
             seen_entities: set[entity_type] = set()  # type: ignore[valid-type]
 
-            for res in results[doc_offset[0] : doc_offset[1]]:
+            for res in doc_results:
                 if res:
                     assert hasattr(res, "reasoning")
                     reasonings.append(res.reasoning)
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import warnings
 from collections.abc import Iterable
-from typing import Any, TypeAlias
+from functools import cached_property
+from typing import Any, ClassVar, TypeAlias
 
 import datasets
 import pydantic
 
+from sieves.cache import ResultCache
 from sieves.data import Doc
 from sieves.engines import Engine, EngineType, dspy_, glix_, ollama_, outlines_
 from sieves.engines.core import EngineInferenceMode, EngineModel, EnginePromptSignature, EngineResult
@@ -39,6 +41,15 @@ class FewshotExample(pydantic.BaseModel):
 
 
 class InformationExtraction(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge]):
+    # Bridge types per supported engine type.
+    _BRIDGE_TYPES: ClassVar[dict[EngineType, type[_TaskBridge]]] = {
+        EngineType.dspy: DSPyInformationExtraction,
+        EngineType.instructor: InstructorInformationExtraction,
+        EngineType.langchain: LangChainInformationExtraction,
+        EngineType.outlines: OutlinesInformationExtraction,
+        EngineType.ollama: OllamaInformationExtraction,
+    }
+
     def __init__(
         self,
         entity_type: type[pydantic.BaseModel],
@@ -49,6 +60,9 @@ class InformationExtraction(PredictiveTask[_TaskPromptSignature, _TaskResult, _T
         prompt_template: str | None = None,
         prompt_signature_desc: str | None = None,
         fewshot_examples: Iterable[FewshotExample] = (),
+        enable_chunk_cache: bool = True,
+        cache: ResultCache | None = None,
+        batch_size: int = 256,
     ) -> None:
         """
         Initializes new PredictiveTask.
@@ -59,14 +73,13 @@ class InformationExtraction(PredictiveTask[_TaskPromptSignature, _TaskResult, _T
         :param prompt_template: Custom prompt template. If None, task's default template is being used.
         :param prompt_signature_desc: Custom prompt signature description. If None, default will be used.
         :param fewshot_examples: Few-shot examples.
+        :param enable_chunk_cache: Whether to run inference only once for identical chunks. Disable if the engine
+            should produce independent results for identical chunks.
+        :param cache: Persistent cache for chunk results. If set, results are reused across runs and only chunks
+            without cached results are run through the engine.
+        :param batch_size: Number of documents processed at once. -1 will process all documents in one go.
         """
         self._entity_type = entity_type
-        if not self._entity_type.model_config.get("frozen", False):
-            warnings.warn(
-                f"Entity type provided to task {self._task_id} isn't frozen, which means that entities can't "
-                f"be deduplicated. Modify entity_type to be frozen=True."
-            )
-
         super().__init__(
             engine=engine,
             task_id=task_id,
@@ -76,24 +89,26 @@ class InformationExtraction(PredictiveTask[_TaskPromptSignature, _TaskResult, _T
             prompt_template=prompt_template,
             prompt_signature_desc=prompt_signature_desc,
             fewshot_examples=fewshot_examples,
+            enable_chunk_cache=enable_chunk_cache,
+            cache=cache,
+            batch_size=batch_size,
         )
 
+        # Check only after super().__init__(), as the task ID is set there.
+        if not self._entity_type.model_config.get("frozen", False):
+            warnings.warn(
+                f"Entity type provided to task {self._task_id} isn't frozen, which means that entities can't "
+                f"be deduplicated. Modify entity_type to be frozen=True."
+            )
+
     def _init_bridge(self, engine_type: EngineType) -> _TaskBridge:
         """Initialize bridge.
         :param engine_type: Type of engine to initialize bridge for.
         :return _TaskBridge: Engine task bridge.
         :raises ValueError: If engine type is not supported.
         """
-        bridge_types: dict[EngineType, type[_TaskBridge]] = {
-            EngineType.dspy: DSPyInformationExtraction,
-            EngineType.instructor: InstructorInformationExtraction,
-            EngineType.langchain: LangChainInformationExtraction,
-            EngineType.outlines: OutlinesInformationExtraction,
-            EngineType.ollama: OllamaInformationExtraction,
-        }
-
         try:
-            bridge = bridge_types[engine_type](
+            bridge = self._BRIDGE_TYPES[engine_type](
                 task_id=self._task_id,
                 prompt_template=self._custom_prompt_template,
                 prompt_signature_desc=self._custom_prompt_signature_desc,
@@ -104,7 +119,7 @@ class InformationExtraction(PredictiveTask[_TaskPromptSignature, _TaskResult, _T
 
         return bridge
 
-    @property
+    @cached_property
     def supports(self) -> set[EngineType]:
         """
         :return set[EngineType]: Supported engine types.
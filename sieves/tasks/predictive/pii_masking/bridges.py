@@ -5,11 +5,13 @@ from functools import cached_property
 from typing import Literal, TypeVar
 
 import dspy
-import jinja2
+import numpy as np
+import numpy.typing as npt
 import pydantic
 
 from sieves.data import Doc
 from sieves.engines import EngineInferenceMode, dspy_, instructor_, langchain_, ollama_, outlines_
+from sieves.engines.core import compile_template
 from sieves.tasks.predictive.bridges import Bridge
 
 _BridgePromptSignature = TypeVar("_BridgePromptSignature")
@@ -89,7 +91,7 @@ class DSPyPIIMasking(PIIBridge[dspy_.PromptSignature, dspy_.Result, dspy_.Infere
             masked_text: str = dspy.OutputField(description="Text with all PII masked.")
             pii_entities: list[PIIEntity] = dspy.OutputField(description="List of PII entities that were masked.")  # type: ignore[valid-type]
 
-        PIIMasking.__doc__ = jinja2.Template(self.prompt_signature_description).render()
+        PIIMasking.__doc__ = compile_template(self.prompt_signature_description).render()
         return PIIMasking
 
     @property
@@ -112,15 +114,13 @@ class DSPyPIIMasking(PIIBridge[dspy_.PromptSignature, dspy_.Result, dspy_.Infere
         return docs
 
     def consolidate(
-        self, results: Iterable[dspy_.Result], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[dspy_.Result], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[dspy_.Result]:
         """Consolidate results from multiple chunks."""
-        results = list(results)
         PIIEntity = self._pii_entity_cls
 
         # Merge results for each document
-        for doc_offset in docs_offsets:
-            doc_results = results[doc_offset[0] : doc_offset[1]]
+        for doc_results in self._results_per_doc(results, docs_offsets):
             seen_entities: set[PIIEntity] = set()  # type: ignore[valid-type]
             entities: list[PIIEntity] = []  # type: ignore[valid-type]
             masked_texts: list[str] = []
@@ -188,7 +188,7 @@ class PydanticBasedPIIMasking(PIIBridge[pydantic.BaseModel, pydantic.BaseModel,
             pii_entities: list[PIIEntity]  # type: ignore[valid-type]
 
         if self.prompt_signature_description:
-            PIIMasking.__doc__ = jinja2.Template(self.prompt_signature_description).render()
+            PIIMasking.__doc__ = compile_template(self.prompt_signature_description).render()
 
         return PIIMasking
 
@@ -206,15 +206,13 @@ class PydanticBasedPIIMasking(PIIBridge[pydantic.BaseModel, pydantic.BaseModel,
         return docs
 
     def consolidate(
-        self, results: Iterable[pydantic.BaseModel], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[pydantic.BaseModel], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[pydantic.BaseModel]:
         """Consolidate results from multiple chunks."""
-        results = list(results)
         PIIEntity = self._pii_entity_cls
 
         # Merge results for each document
-        for doc_offset in docs_offsets:
-            doc_results = results[doc_offset[0] : doc_offset[1]]
+        for doc_results in self._results_per_doc(results, docs_offsets):
             seen_entities: set[PIIEntity] = set()  # type: ignore[valid-type]
             entities: list[PIIEntity] = []  # type: ignore[valid-type]
             masked_texts: list[str] = []
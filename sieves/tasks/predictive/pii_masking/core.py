@@ -1,10 +1,12 @@
 """Allows masking of PII (Personally Identifiable Information) in text documents."""
 from collections.abc import Iterable
-from typing import Any, TypeAlias
+from functools import cached_property
+from typing import Any, ClassVar, TypeAlias
 
 import datasets
 import pydantic
 
+from sieves.cache import ResultCache
 from sieves.data.doc import Doc
 from sieves.engines import (
     Engine,
@@ -51,6 +53,15 @@ class FewshotExample(pydantic.BaseModel):
 class PIIMasking(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge]):
     """Task for masking PII (Personally Identifiable Information) in text documents."""
 
+    # Bridge types per supported engine type.
+    _BRIDGE_TYPES: ClassVar[dict[EngineType, type[_TaskBridge]]] = {
+        EngineType.dspy: DSPyPIIMasking,
+        EngineType.instructor: InstructorPIIMasking,
+        EngineType.langchain: LangChainPIIMasking,
+        EngineType.outlines: OutlinesPIIMasking,
+        EngineType.ollama: OllamaPIIMasking,
+    }
+
     def __init__(
         self,
         engine: Engine[EnginePromptSignature, EngineResult, EngineModel, EngineInferenceMode],
@@ -63,6 +74,9 @@ class PIIMasking(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge])
         prompt_template: str | None = None,
         prompt_signature_desc: str | None = None,
         fewshot_examples: Iterable[FewshotExample] = (),
+        enable_chunk_cache: bool = True,
+        cache: ResultCache | None = None,
+        batch_size: int = 256,
     ) -> None:
         """
         Initialize PIIMasking task.
@@ -78,6 +92,11 @@ class PIIMasking(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge])
         :param prompt_template: Custom prompt template. If None, task's default template is used.
         :param prompt_signature_desc: Custom prompt signature description. If None, default will be used.
         :param fewshot_examples: Few-shot examples.
+        :param enable_chunk_cache: Whether to run inference only once for identical chunks. Disable if the engine
+            should produce independent results for identical chunks.
+        :param cache: Persistent cache for chunk results. If set, results are reused across runs and only chunks
+            without cached results are run through the engine.
+        :param batch_size: Number of documents processed at once. -1 will process all documents in one go.
         """
         self._pii_types = pii_types
         self._mask_placeholder = mask_placeholder
@@ -91,6 +110,9 @@ class PIIMasking(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge])
             prompt_template=prompt_template,
             prompt_signature_desc=prompt_signature_desc,
             fewshot_examples=fewshot_examples,
+            enable_chunk_cache=enable_chunk_cache,
+            cache=cache,
+            batch_size=batch_size,
         )
 
     def _init_bridge(self, engine_type: EngineType) -> _TaskBridge:
@@ -99,16 +121,8 @@ class PIIMasking(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge])
         :return PIIBridge: Engine task bridge.
         :raises ValueError: If engine type is not supported.
         """
-        bridge_types: dict[EngineType, type[_TaskBridge]] = {
-            EngineType.dspy: DSPyPIIMasking,
-            EngineType.instructor: InstructorPIIMasking,
-            EngineType.langchain: LangChainPIIMasking,
-            EngineType.outlines: OutlinesPIIMasking,
-            EngineType.ollama: OllamaPIIMasking,
-        }
-
         try:
-            return bridge_types[engine_type](
+            return self._BRIDGE_TYPES[engine_type](
                 task_id=self._task_id,
                 prompt_template=self._custom_prompt_template,
                 prompt_signature_desc=self._custom_prompt_signature_desc,
@@ -119,7 +133,7 @@ class PIIMasking(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge])
         except KeyError as err:
             raise KeyError(f"Engine type {engine_type} is not supported by {self.__class__.__name__}.") from err
 
-    @property
+    @cached_property
     def supports(self) -> set[EngineType]:
         """
         :return set[EngineType]: Supported engine types.
@@ -1,15 +1,18 @@
 import abc
+import operator
 from collections.abc import Iterable
 from functools import cached_property
 from typing import Any, TypeVar
 
 import dspy
-import jinja2
+import numpy as np
+import numpy.typing as npt
 import pydantic
 
 from sieves.data import Doc
-from sieves.engines import EngineInferenceMode, dspy_, instructor_, langchain_, ollama_, outlines_
-from sieves.tasks.predictive.bridges import Bridge
+from sieves.engines import EngineInferenceMode, dspy_, glix_, instructor_, langchain_, ollama_, outlines_
+from sieves.engines.core import compile_template
+from sieves.tasks.predictive.bridges import Bridge, GliXBridge
 
 _BridgePromptSignature = TypeVar("_BridgePromptSignature")
 _BridgeResult = TypeVar("_BridgeResult")
@@ -64,7 +67,7 @@ class DSPyQA(QABridge[dspy_.PromptSignature, dspy_.Result, dspy_.InferenceMode])
                 max_length=n_questions,
             )
 
-        QuestionAnswering.__doc__ = jinja2.Template(self.prompt_signature_description).render()
+        QuestionAnswering.__doc__ = compile_template(self.prompt_signature_description).render()
 
         return QuestionAnswering
 
@@ -79,22 +82,65 @@ class DSPyQA(QABridge[dspy_.PromptSignature, dspy_.Result, dspy_.InferenceMode])
         return docs
 
     def consolidate(
-        self, results: Iterable[dspy_.Result], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[dspy_.Result], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[dspy_.Result]:
-        results = list(results)
-
         # Merge all QAs.
-        for doc_offset in docs_offsets:
-            doc_results = results[doc_offset[0] : doc_offset[1]]
-            answers: list[str] = [""] * len(self._questions)
+        for doc_results in self._results_per_doc(results, docs_offsets):
+            # Collect chunk answers per question and join them once, instead of concatenating strings per chunk.
+            answers_per_question: list[list[str]] = [[] for _ in self._questions]
 
             for res in doc_results:
                 for i, answer in enumerate(res.answers):
-                    answers[i] = f"{answers[i]} {answer}".strip()
+                    answers_per_question[i].append(answer)
 
+            answers = [" ".join(answers_q).strip() for answers_q in answers_per_question]
             yield dspy.Prediction.from_completions({"answers": [answers]}, signature=self.prompt_signature)
 
 
+class GliXQA(GliXBridge):
+    def __init__(
+        self, task_id: str, prompt_template: str | None, prompt_signature_desc: str | None, questions: list[str]
+    ):
+        """
+        Initializes GliX question answering bridge.
+        :param task_id: Task ID.
+        :param prompt_template: Custom prompt template.
+        :param prompt_signature_desc: Custom prompt signature description.
+        :param questions: Questions to answer.
+        """
+        super().__init__(
+            task_id=task_id,
+            prompt_template=prompt_template,
+            prompt_signature_desc=prompt_signature_desc,
+            prompt_signature=questions,
+            inference_mode=glix_.InferenceMode.question_answering,
+        )
+
+    def integrate(self, results: Iterable[glix_.Result], docs: Iterable[Doc]) -> Iterable[Doc]:
+        for doc, result in zip(docs, results):
+            # Record best answer per question, so that results have the same structure as with other engines.
+            best_answers: list[str] = []
+            for answers in result:
+                assert isinstance(answers, list)
+                best_answers.append(str(answers[0]["answer"]) if answers else "")
+            doc.results[self._task_id] = best_answers
+        return docs
+
+    def consolidate(
+        self, results: Iterable[glix_.Result], docs_offsets: npt.NDArray[np.int32]
+    ) -> Iterable[glix_.Result]:
+        # Merge answers of all chunks per question, sorted by score in descending order.
+        for doc_results in self._results_per_doc(results, docs_offsets):
+            answers_per_question: list[list[dict[str, str | float]]] = [[] for _ in self._prompt_signature]
+
+            for res in doc_results:
+                for i, answers in enumerate(res):
+                    assert isinstance(answers, list)
+                    answers_per_question[i].extend(answers)
+
+            yield [sorted(answers, key=operator.itemgetter("score"), reverse=True) for answers in answers_per_question]
+
+
 class PydanticBasedQA(QABridge[pydantic.BaseModel, pydantic.BaseModel, EngineInferenceMode], abc.ABC):
     @property
     def _prompt_template(self) -> str | None:
@@ -142,26 +188,24 @@ class PydanticBasedQA(QABridge[pydantic.BaseModel, pydantic.BaseModel, EngineInf
         )
 
         if self.prompt_signature_description:
-            prompt_sig.__doc__ = jinja2.Template(self.prompt_signature_description).render()
+            prompt_sig.__doc__ = compile_template(self.prompt_signature_description).render()
 
         assert isinstance(prompt_sig, type) and issubclass(prompt_sig, pydantic.BaseModel)
         return prompt_sig
 
     def integrate(self, results: Iterable[pydantic.BaseModel], docs: Iterable[Doc]) -> Iterable[Doc]:
-        for doc, result in zip(docs, results):
-            assert hasattr(result, "answers")
-            doc.results[self._task_id] = result.answers
+        task_id = self._task_id
+        for doc, answers in zip(docs, map(operator.attrgetter("answers"), results)):
+            doc.results[task_id] = answers
         return docs
 
     def consolidate(
-        self, results: Iterable[pydantic.BaseModel], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[pydantic.BaseModel], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[pydantic.BaseModel]:
-        results = list(results)
-
-        # Determine label scores for chunks per document.
-        for doc_offset in docs_offsets:
-            doc_results = results[doc_offset[0] : doc_offset[1]]
-            answers: list[str] = [""] * len(self._questions)
+        # Merge all QAs.
+        for doc_results in self._results_per_doc(results, docs_offsets):
+            # Collect chunk answers per question and join them once, instead of concatenating strings per chunk.
+            answers_per_question: list[list[str]] = [[] for _ in self._questions]
             reasonings: list[str] = []
 
             for rec in doc_results:
@@ -169,8 +213,9 @@ class PydanticBasedQA(QABridge[pydantic.BaseModel, pydantic.BaseModel, EngineInf
                 assert hasattr(rec, "answers")
                 reasonings.append(rec.reasoning)
                 for i, answer in enumerate(rec.answers):
-                    answers[i] += answer + " "
+                    answers_per_question[i].append(answer)
 
+            answers = [" ".join(answers_q) for answers_q in answers_per_question]
             yield self.prompt_signature(reasoning=str(reasonings), answers=answers)
 
 
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import Any, TypeAlias
+from functools import cached_property
+from typing import Any, ClassVar, TypeAlias
 
 import datasets
 import pydantic
 
+from sieves.cache import ResultCache
 from sieves.data import Doc
 from sieves.engines import Engine, EngineType, dspy_, glix_
 from sieves.engines.core import EngineInferenceMode, EngineModel, EnginePromptSignature, EngineResult
 from sieves.serialization import Config
-from sieves.tasks.predictive.bridges import GliXBridge
 from sieves.tasks.predictive.core import PredictiveTask
 from sieves.tasks.predictive.question_answering.bridges import (
     DSPyQA,
+    GliXQA,
     InstructorQA,
     LangChainQA,
     OllamaQA,
@@ -22,7 +24,7 @@ from sieves.tasks.predictive.question_answering.bridges import (
 
 _TaskPromptSignature: TypeAlias = glix_.PromptSignature | pydantic.BaseModel | dspy_.PromptSignature
 _TaskResult: TypeAlias = pydantic.BaseModel | dspy_.Result
-_TaskBridge: TypeAlias = DSPyQA | GliXBridge | InstructorQA | LangChainQA | OllamaQA | OutlinesQA
+_TaskBridge: TypeAlias = DSPyQA | GliXQA | InstructorQA | LangChainQA | OllamaQA | OutlinesQA
 
 
 class FewshotExample(pydantic.BaseModel):
@@ -33,6 +35,16 @@ class FewshotExample(pydantic.BaseModel):
 
 
 class QuestionAnswering(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge]):
+    # Bridge types per supported engine type. Engine types whose bridges have to be initialized differently (GliX) are
+    # handled separately in _init_bridge().
+    _BRIDGE_TYPES: ClassVar[dict[EngineType, type[_TaskBridge]]] = {
+        EngineType.dspy: DSPyQA,
+        EngineType.instructor: InstructorQA,
+        EngineType.outlines: OutlinesQA,
+        EngineType.ollama: OllamaQA,
+        EngineType.langchain: LangChainQA,
+    }
+
     def __init__(
         self,
         questions: list[str],
@@ -43,6 +55,9 @@ class QuestionAnswering(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskB
         prompt_template: str | None = None,
         prompt_signature_desc: str | None = None,
         fewshot_examples: Iterable[FewshotExample] = (),
+        enable_chunk_cache: bool = True,
+        cache: ResultCache | None = None,
+        batch_size: int = 256,
     ) -> None:
         """
         Initializes new PredictiveTask.
@@ -53,6 +68,11 @@ class QuestionAnswering(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskB
         :param prompt_template: Custom prompt template. If None, task's default template is being used.
         :param prompt_signature_desc: Custom prompt signature description. If None, default will be used.
         :param fewshot_examples: Few-shot examples.
+        :param enable_chunk_cache: Whether to run inference only once for identical chunks. Disable if the engine
+            should produce independent results for identical chunks.
+        :param cache: Persistent cache for chunk results. If set, results are reused across runs and only chunks
+            without cached results are run through the engine.
+        :param batch_size: Number of documents processed at once. -1 will process all documents in one go.
         """
         self._questions = questions
         super().__init__(
@@ -64,6 +84,9 @@ class QuestionAnswering(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskB
             prompt_template=prompt_template,
             prompt_signature_desc=prompt_signature_desc,
             fewshot_examples=fewshot_examples,
+            enable_chunk_cache=enable_chunk_cache,
+            cache=cache,
+            batch_size=batch_size,
         )
         self._fewshot_examples: Iterable[FewshotExample]
 
@@ -73,25 +96,16 @@ class QuestionAnswering(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskB
         :raises ValueError: If engine type is not supported.
         """
         if engine_type == EngineType.glix:
-            return GliXBridge(
+            return GliXQA(
                 task_id=self._task_id,
                 prompt_template=self._custom_prompt_template,
                 prompt_signature_desc=self._custom_prompt_signature_desc,
-                prompt_signature=self._questions,
-                inference_mode=glix_.InferenceMode.question_answering,
+                questions=self._questions,
             )
 
-        bridge_types: dict[EngineType, type[_TaskBridge]] = {
-            EngineType.dspy: DSPyQA,
-            EngineType.instructor: InstructorQA,
-            EngineType.outlines: OutlinesQA,
-            EngineType.ollama: OllamaQA,
-            EngineType.langchain: LangChainQA,
-        }
-
         try:
-            bridge_type = bridge_types[engine_type]
-            assert not issubclass(bridge_type, GliXBridge)
+            bridge_type = self._BRIDGE_TYPES[engine_type]
+            assert not issubclass(bridge_type, GliXQA)
 
             return bridge_type(
                 task_id=self._task_id,
@@ -102,9 +116,16 @@ class QuestionAnswering(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskB
         except KeyError as err:
             raise KeyError(f"Engine type {engine_type} is not supported by {self.__class__.__name__}.") from err
 
-    @property
+    @cached_property
     def supports(self) -> set[EngineType]:
-        return {EngineType.dspy, EngineType.instructor, EngineType.langchain, EngineType.ollama, EngineType.outlines}
+        return {
+            EngineType.dspy,
+            EngineType.glix,
+            EngineType.instructor,
+            EngineType.langchain,
+            EngineType.ollama,
+            EngineType.outlines,
+        }
 
     @property
     def _state(self) -> dict[str, Any]:
@@ -124,18 +145,5 @@ class QuestionAnswering(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskB
             features=features,
         )
 
-        # Fetch data used for generating dataset.
-        try:
-            data = [(doc.text, doc.results[self._task_id]) for doc in docs]
-        except KeyError as err:
-            raise KeyError(f"Not all documents have results for this task with ID {self._task_id}") from err
-
-        def generate_data() -> Iterable[dict[str, Any]]:
-            """Yields results as dicts.
-            :return: Results as dicts.
-            """
-            for text, answers in data:
-                yield {"text": text, "answers": answers}
-
         # Create dataset.
-        return datasets.Dataset.from_generator(generate_data, features=features, info=info)
+        return self._results_to_dataset(docs, "answers", features, info)
@@ -1,14 +1,17 @@
 import abc
+import operator
 from collections.abc import Iterable
 from functools import cached_property
 from typing import Literal, TypeVar
 
 import dspy
-import jinja2
+import numpy as np
+import numpy.typing as npt
 import pydantic
 
 from sieves.data import Doc
 from sieves.engines import EngineInferenceMode, dspy_, instructor_, langchain_, ollama_, outlines_
+from sieves.engines.core import compile_template
 from sieves.tasks.predictive.bridges import Bridge
 
 _BridgePromptSignature = TypeVar("_BridgePromptSignature")
@@ -33,6 +36,7 @@ class SentAnalysisBridge(Bridge[_BridgePromptSignature, _BridgeResult, EngineInf
             overwrite=False,
         )
         self._aspects = aspects
+        self._aspect_to_idx = {aspect: i for i, aspect in enumerate(aspects)}
 
 
 class DSPySentimentAnalysis(SentAnalysisBridge[dspy_.PromptSignature, dspy_.Result, dspy_.InferenceMode]):
@@ -64,7 +68,7 @@ class DSPySentimentAnalysis(SentAnalysisBridge[dspy_.PromptSignature, dspy_.Resu
                 description="Sentiment in this text with respect to the corresponding aspect."
             )
 
-        SentimentAnalysis.__doc__ = jinja2.Template(self.prompt_signature_description).render()
+        SentimentAnalysis.__doc__ = compile_template(self.prompt_signature_description).render()
 
         return SentimentAnalysis
 
@@ -76,44 +80,35 @@ class DSPySentimentAnalysis(SentAnalysisBridge[dspy_.PromptSignature, dspy_.Resu
         for doc, result in zip(docs, results):
             assert len(result.completions.sentiment_per_aspect) == 1
             sorted_preds = sorted(
-                [(aspect, score) for aspect, score in result.completions.sentiment_per_aspect[0].items()],
-                key=lambda x: x[1],
-                reverse=True,
+                result.completions.sentiment_per_aspect[0].items(), key=operator.itemgetter(1), reverse=True
             )
             doc.results[self._task_id] = sorted_preds
         return docs
 
     def consolidate(
-        self, results: Iterable[dspy_.Result], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[dspy_.Result], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[dspy_.Result]:
-        results = list(results)
-
         # Determine label scores for chunks per document.
-        for doc_offset in docs_offsets:
-            aspect_scores: dict[str, float] = {label: 0.0 for label in self._aspects}
-            doc_results = results[doc_offset[0] : doc_offset[1]]
+        for doc_results in self._results_per_doc(results, docs_offsets):
+            scores = np.zeros((len(doc_results), len(self._aspects)), dtype=np.float64)
 
-            for res in doc_results:
+            for i, res in enumerate(doc_results):
                 assert len(res.completions.sentiment_per_aspect) == 1
-                for label, score in res.completions.sentiment_per_aspect[0].items():
-                    # Clamp score to range between 0 and 1. Alternatively we could force this in the prompt signature,
-                    # but this fails occasionally with some models and feels too strict (maybe a strict mode would be
-                    # useful?).
-                    aspect_scores[label] += max(0, min(score, 1))
-
-            sorted_aspect_scores: list[dict[str, str | float]] = sorted(
-                [
-                    {"aspect": aspect, "score": score / (doc_offset[1] - doc_offset[0])}
-                    for aspect, score in aspect_scores.items()
-                ],
-                key=lambda x: x["score"],
-                reverse=True,
-            )
+                for aspect, score in res.completions.sentiment_per_aspect[0].items():
+                    scores[i, self._aspect_to_idx[aspect]] = score
+
+            # Clamp scores to range between 0 and 1. Alternatively we could force this in the prompt signature, but
+            # this fails occasionally with some models and feels too strict (maybe a strict mode would be useful?).
+            np.clip(scores, 0, 1, out=scores)
+            # Average scores, sort aspects by them in descending order.
+            mean_scores = scores.mean(axis=0)
+            sorted_idx = np.argsort(-mean_scores, kind="stable")
+            sorted_aspects = [self._aspects[i] for i in sorted_idx.tolist()]
 
             yield dspy.Prediction.from_completions(
                 {
-                    "sentiment_per_aspect": [{sls["aspect"]: sls["score"] for sls in sorted_aspect_scores}],
-                    "reasoning": [str([res.reasoning for res in doc_results])],
+                    "sentiment_per_aspect": [dict(zip(sorted_aspects, mean_scores[sorted_idx].tolist()))],
+                    "reasoning": [" | ".join(res.reasoning for res in doc_results)],
                 },
                 signature=self.prompt_signature,
             )
@@ -171,42 +166,39 @@ class PydanticBasedSentAnalysis(
         )
 
         if self.prompt_signature_description:
-            prompt_sig.__doc__ = jinja2.Template(self.prompt_signature_description).render()
+            prompt_sig.__doc__ = compile_template(self.prompt_signature_description).render()
 
         assert isinstance(prompt_sig, type) and issubclass(prompt_sig, pydantic.BaseModel)
         return prompt_sig
 
     def integrate(self, results: Iterable[pydantic.BaseModel], docs: Iterable[Doc]) -> Iterable[Doc]:
         for doc, result in zip(docs, results):
-            label_scores = {k: v for k, v in result.model_dump().items() if k != "reasoning"}
-            doc.results[self._task_id] = sorted(
-                [(aspect, score) for aspect, score in label_scores.items()], key=lambda x: x[1], reverse=True
-            )
+            # Read aspect scores directly from result attributes instead of serializing the whole result object.
+            aspect_scores = [(aspect, getattr(result, aspect)) for aspect in self._aspects]
+            doc.results[self._task_id] = sorted(aspect_scores, key=operator.itemgetter(1), reverse=True)
         return docs
 
     def consolidate(
-        self, results: Iterable[pydantic.BaseModel], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[pydantic.BaseModel], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[pydantic.BaseModel]:
-        results = list(results)
-
         # Determine label scores for chunks per document.
-        reasonings: list[str] = []
-        for doc_offset in docs_offsets:
-            aspect_scores: dict[str, float] = {label: 0.0 for label in self._aspects}
-            doc_results = results[doc_offset[0] : doc_offset[1]]
+        for doc_results in self._results_per_doc(results, docs_offsets):
+            scores = np.zeros((len(doc_results), len(self._aspects)), dtype=np.float64)
 
-            for rec in doc_results:
+            reasonings: list[str] = []
+            for i, rec in enumerate(doc_results):
                 assert hasattr(rec, "reasoning")
                 reasonings.append(rec.reasoning)
-                for aspect in self._aspects:
-                    # Clamp score to range between 0 and 1. Alternatively we could force this in the prompt signature,
-                    # but this fails occasionally with some models and feels too strict (maybe a strict mode would be
-                    # useful?).
-                    aspect_scores[aspect] += max(0, min(getattr(rec, aspect), 1))
+                scores[i] = [getattr(rec, aspect) for aspect in self._aspects]
+
+            # Clamp scores to range between 0 and 1. Alternatively we could force this in the prompt signature, but
+            # this fails occasionally with some models and feels too strict (maybe a strict mode would be useful?).
+            np.clip(scores, 0, 1, out=scores)
+            mean_scores = scores.mean(axis=0).tolist()
 
             yield self.prompt_signature(
-                reasoning=str(reasonings),
-                **{aspect: score / (doc_offset[1] - doc_offset[0]) for aspect, score in aspect_scores.items()},
+                reasoning=" | ".join(reasonings),
+                **dict(zip(self._aspects, mean_scores)),
             )
 
 
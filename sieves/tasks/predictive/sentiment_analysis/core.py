@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import Any, TypeAlias
+from functools import cached_property
+from typing import Any, ClassVar, TypeAlias
 
 import datasets
 import pydantic
 
+from sieves.cache import ResultCache
 from sieves.data import Doc
 from sieves.engines import Engine, EngineType, dspy_
 from sieves.engines.core import EngineInferenceMode, EngineModel, EnginePromptSignature, EngineResult
@@ -46,6 +48,15 @@ class FewshotExample(pydantic.BaseModel):
 
 
 class SentimentAnalysis(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge]):
+    # Bridge types per supported engine type.
+    _BRIDGE_TYPES: ClassVar[dict[EngineType, type[_TaskBridge]]] = {
+        EngineType.dspy: DSPySentimentAnalysis,
+        EngineType.instructor: InstructorSentimentAnalysis,
+        EngineType.outlines: OutlinesSentimentAnalysis,
+        EngineType.ollama: OllamaSentimentAnalysis,
+        EngineType.langchain: LangChainSentimentAnalysis,
+    }
+
     def __init__(
         self,
         engine: Engine[EnginePromptSignature, EngineResult, EngineModel, EngineInferenceMode],
@@ -56,6 +67,9 @@ class SentimentAnalysis(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskB
         prompt_template: str | None = None,
         prompt_signature_desc: str | None = None,
         fewshot_examples: Iterable[FewshotExample] = (),
+        enable_chunk_cache: bool = True,
+        cache: ResultCache | None = None,
+        batch_size: int = 256,
     ) -> None:
         """
         Initializes new SentimentAnalysis task.
@@ -67,6 +81,11 @@ class SentimentAnalysis(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskB
         :param prompt_template: Custom prompt template. If None, task's default template is being used.
         :param prompt_signature_desc: Custom prompt signature description. If None, default will be used.
         :param fewshot_examples: Few-shot examples.
+        :param enable_chunk_cache: Whether to run inference only once for identical chunks. Disable if the engine
+            should produce independent results for identical chunks.
+        :param cache: Persistent cache for chunk results. If set, results are reused across runs and only chunks
+            without cached results are run through the engine.
+        :param batch_size: Number of documents processed at once. -1 will process all documents in one go.
         """
         self._aspects = tuple(sorted(set(aspects) | {"overall"}))
         super().__init__(
@@ -78,6 +97,9 @@ class SentimentAnalysis(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskB
             prompt_template=prompt_template,
             prompt_signature_desc=prompt_signature_desc,
             fewshot_examples=fewshot_examples,
+            enable_chunk_cache=enable_chunk_cache,
+            cache=cache,
+            batch_size=batch_size,
         )
         self._fewshot_examples: Iterable[FewshotExample]
 
@@ -86,16 +108,8 @@ class SentimentAnalysis(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskB
         :return: Engine task.
         :raises ValueError: If engine type is not supported.
         """
-        bridge_types: dict[EngineType, type[_TaskBridge]] = {
-            EngineType.dspy: DSPySentimentAnalysis,
-            EngineType.instructor: InstructorSentimentAnalysis,
-            EngineType.outlines: OutlinesSentimentAnalysis,
-            EngineType.ollama: OllamaSentimentAnalysis,
-            EngineType.langchain: LangChainSentimentAnalysis,
-        }
-
         try:
-            bridge_type = bridge_types[engine_type]
+            bridge_type = self._BRIDGE_TYPES[engine_type]
 
             return bridge_type(
                 task_id=self._task_id,
@@ -106,7 +120,7 @@ class SentimentAnalysis(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskB
         except KeyError as err:
             raise KeyError(f"Engine type {engine_type} is not supported by {self.__class__.__name__}.") from err
 
-    @property
+    @cached_property
     def supports(self) -> set[EngineType]:
         return {
             EngineType.dspy,
@@ -1,19 +1,84 @@
 import abc
+import functools
+import operator
+import textwrap
 from collections.abc import Iterable
 from functools import cached_property
 from typing import Any, TypeVar
 
 import dspy
-import jinja2
+import numpy as np
+import numpy.typing as npt
 import pydantic
 
 from sieves.data import Doc
 from sieves.engines import EngineInferenceMode, dspy_, instructor_, langchain_, ollama_, outlines_
+from sieves.engines.core import compile_template
 from sieves.tasks.predictive.bridges import Bridge
 
 _BridgePromptSignature = TypeVar("_BridgePromptSignature")
 _BridgeResult = TypeVar("_BridgeResult")
 
+# Default prompt template for Pydantic-based engines. Defined at module level, so that all bridge instances with the
+# same number of words share the same string - and hence the same compiled template in compile_template()'s cache.
+# Dedented, so that the source code's indentation doesn't end up in the prompts (and doesn't cost tokens).
+_PROMPT_TEMPLATE = textwrap.dedent(
+    """
+        Your goal is to summarize a text. This summary should be around {{ n_words }} words.
+
+        {% if examples|length > 0 -%}
+            Examples:
+            ----------
+            {%- for example in examples %}
+                Text: "{{ example.text }}":
+                Approximate number of words in summary: {{ example.n_words }}
+                Summary: "{{ example.summary }}"
+            {% endfor -%}
+            ----------
+        {% endif -%}
+
+        ========
+        Text: {{ text }}
+        Approximate number of words in summary: {{ n_words }}
+        Summary: 
+        """
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_dspy_signature(signature_desc: str | None) -> type[dspy_.PromptSignature]:
+    """Builds DSPy signature for summarization. Cached, as identical descriptions yield identical signatures - so tasks
+    sharing those don't have to recreate them.
+    :param signature_desc: Prompt signature description.
+    :return type[dspy_.PromptSignature]: DSPy signature for summarization.
+    """
+
+    class Summary(dspy.Signature):  # type: ignore[misc]
+        text: str = dspy.InputField(description="Text to summarize.")
+        n_words: str = dspy.InputField(description="Number of words to approximately use for summary.")
+        summary: str = dspy.OutputField(description="Summary of text.")
+
+    Summary.__doc__ = compile_template(signature_desc).render()
+
+    return Summary
+
+
+@functools.lru_cache(maxsize=128)
+def _build_pydantic_signature(signature_desc: str | None) -> type[pydantic.BaseModel]:
+    """Builds Pydantic signature for summarization. Cached, as identical descriptions yield identical signatures - so
+    tasks sharing those don't have to recreate them.
+    :param signature_desc: Prompt signature description.
+    :return type[pydantic.BaseModel]: Pydantic signature for summarization.
+    """
+
+    class Summary(pydantic.BaseModel, frozen=True):
+        summary: str
+
+    if signature_desc:
+        Summary.__doc__ = compile_template(signature_desc).render()
+
+    return Summary
+
 
 class SummarizationBridge(
     Bridge[_BridgePromptSignature, _BridgeResult, EngineInferenceMode],
@@ -58,45 +123,34 @@ class DSPySummarization(SummarizationBridge[dspy_.PromptSignature, dspy_.Result,
 
     @cached_property
     def prompt_signature(self) -> type[dspy_.PromptSignature]:
-        class Summary(dspy.Signature):  # type: ignore[misc]
-            text: str = dspy.InputField(description="Text to summarize.")
-            n_words: str = dspy.InputField(description="Number of words to approximately use for summary.")
-            summary: str = dspy.OutputField(description="Summary of text.")
-
-        Summary.__doc__ = jinja2.Template(self.prompt_signature_description).render()
-
-        return Summary
+        return _build_dspy_signature(self.prompt_signature_description)
 
     @property
     def inference_mode(self) -> dspy_.InferenceMode:
         return dspy_.InferenceMode.chain_of_thought
 
     def integrate(self, results: Iterable[dspy_.Result], docs: Iterable[Doc]) -> Iterable[Doc]:
-        for doc, result in zip(docs, results):
-            assert len(result.completions.summary) == 1
-            doc.results[self._task_id] = result.summary
+        task_id = self._task_id
+        for doc, summary in zip(docs, map(operator.attrgetter("summary"), results)):
+            doc.results[task_id] = summary
 
             if self._overwrite:
-                doc.text = result.summary
+                doc.text = summary
 
         return docs
 
     def consolidate(
-        self, results: Iterable[dspy_.Result], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[dspy_.Result], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[dspy_.Result]:
-        results = list(results)
-
-        # Merge all chunk translations.
-        for doc_offset in docs_offsets:
-            summaries: list[str] = []
-
-            for res in results[doc_offset[0] : doc_offset[1]]:
-                if res is None:
-                    continue
-                summaries.append(res.summary)
+        # Merge all chunk summaries.
+        for doc_results in self._results_per_doc(results, docs_offsets):
+            # Single chunk: nothing to merge, so pass result through as it is.
+            if len(doc_results) == 1 and doc_results[0] is not None:
+                yield doc_results[0]
+                continue
 
             yield dspy.Prediction.from_completions(
-                {"summary": ["\n".join(summaries)]},
+                {"summary": ["\n".join(res.summary for res in doc_results if res is not None)]},
                 signature=self.prompt_signature,
             )
 
@@ -107,25 +161,9 @@ class PydanticBasedSummarization(
 ):
     @property
     def _prompt_template(self) -> str | None:
-        return """
-        Your goal is to summarize a text. This summary should be around {{ max_n }} words.
-
-        {% if examples|length > 0 -%}
-            Examples:
-            ----------
-            {%- for example in examples %}
-                Text: "{{ example.text }}":
-                Approximate number of words in summary: {{ example.n_words }}
-                Summary: "{{ example.summary }}"
-            {% endfor -%}
-            ----------
-        {% endif -%}
-
-        ========
-        Text: {{ text }}
-        Approximate number of words in summary: {{ n_words }}
-        Summary: 
-        """
+        # The number of words is the same for all documents, so we bake it into the template instead of resolving it
+        # per document. Few-shot examples still use their own values (example.n_words).
+        return _PROMPT_TEMPLATE.replace("{{ n_words }}", str(self._n_words))
 
     @property
     def _prompt_signature_description(self) -> str | None:
@@ -133,37 +171,30 @@ class PydanticBasedSummarization(
 
     @cached_property
     def prompt_signature(self) -> type[pydantic.BaseModel]:
-        class Summary(pydantic.BaseModel, frozen=True):
-            summary: str
-
-        if self.prompt_signature_description:
-            Summary.__doc__ = jinja2.Template(self.prompt_signature_description).render()
-
-        return Summary
+        return _build_pydantic_signature(self.prompt_signature_description)
 
     def integrate(self, results: Iterable[pydantic.BaseModel], docs: Iterable[Doc]) -> Iterable[Doc]:
-        for doc, result in zip(docs, results):
-            assert hasattr(result, "summary")
-            doc.results[self._task_id] = result.summary
+        task_id = self._task_id
+        for doc, summary in zip(docs, map(operator.attrgetter("summary"), results)):
+            doc.results[task_id] = summary
 
             if self._overwrite:
-                doc.text = result.summary
+                doc.text = summary
         return docs
 
     def consolidate(
-        self, results: Iterable[pydantic.BaseModel], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[pydantic.BaseModel], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[pydantic.BaseModel]:
-        results = list(results)
-
-        # Determine label scores for chunks per document.
-        for doc_offset in docs_offsets:
-            summaries: list[str] = []
-
-            for res in results[doc_offset[0] : doc_offset[1]]:
-                if res:
-                    assert hasattr(res, "summary")
-                    summaries.append(res.summary)
-
+        # Merge all chunk summaries.
+        for doc_results in self._results_per_doc(results, docs_offsets):
+            # Single chunk: nothing to merge, so pass result through as it is (unless its summary has to be stripped).
+            if len(doc_results) == 1 and doc_results[0]:
+                res = doc_results[0]
+                assert hasattr(res, "summary")
+                yield res if res.summary == res.summary.strip() else self.prompt_signature(summary=res.summary.strip())
+                continue
+
+            summaries = map(operator.attrgetter("summary"), filter(None, doc_results))
             yield self.prompt_signature(summary="\n".join(summaries).strip())
 
 
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import Any, TypeAlias
+from functools import cached_property
+from typing import Any, ClassVar, TypeAlias
 
 import datasets
 import pydantic
 
+from sieves.cache import ResultCache
 from sieves.data import Doc
 from sieves.engines import Engine, EngineType, dspy_, glix_, ollama_, outlines_
 from sieves.engines.core import EngineInferenceMode, EngineModel, EnginePromptSignature, EngineResult
@@ -39,6 +41,16 @@ class FewshotExample(pydantic.BaseModel):
 
 
 class Summarization(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge]):
+    # Bridge types per supported engine type. Engine types whose bridges have to be initialized differently (GliX) are
+    # handled separately in _init_bridge().
+    _BRIDGE_TYPES: ClassVar[dict[EngineType, type[_TaskBridge]]] = {
+        EngineType.dspy: DSPySummarization,
+        EngineType.instructor: InstructorSummarization,
+        EngineType.langchain: LangChainSummarization,
+        EngineType.outlines: OutlinesSummarization,
+        EngineType.ollama: OllamaSummarization,
+    }
+
     def __init__(
         self,
         n_words: int,
@@ -50,6 +62,9 @@ class Summarization(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridg
         prompt_template: str | None = None,
         prompt_signature_desc: str | None = None,
         fewshot_examples: Iterable[FewshotExample] = (),
+        enable_chunk_cache: bool = True,
+        cache: ResultCache | None = None,
+        batch_size: int = 256,
     ) -> None:
         """
         Initializes new Summarization task.
@@ -63,6 +78,11 @@ class Summarization(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridg
         :param prompt_template: Custom prompt template. If None, task's default template is being used.
         :param prompt_signature_desc: Custom prompt signature description. If None, default will be used.
         :param fewshot_examples: Few-shot examples.
+        :param enable_chunk_cache: Whether to run inference only once for identical chunks. Disable if the engine
+            should produce independent results for identical chunks.
+        :param cache: Persistent cache for chunk results. If set, results are reused across runs and only chunks
+            without cached results are run through the engine.
+        :param batch_size: Number of documents processed at once. -1 will process all documents in one go.
         """
         self._n_words = n_words
 
@@ -75,6 +95,9 @@ class Summarization(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridg
             prompt_template=prompt_template,
             prompt_signature_desc=prompt_signature_desc,
             fewshot_examples=fewshot_examples,
+            enable_chunk_cache=enable_chunk_cache,
+            cache=cache,
+            batch_size=batch_size,
         )
 
     def _init_bridge(self, engine_type: EngineType) -> _TaskBridge:
@@ -92,16 +115,8 @@ class Summarization(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridg
                 inference_mode=glix_.InferenceMode.summarization,
             )
 
-        bridge_types: dict[EngineType, type[_TaskBridge]] = {
-            EngineType.dspy: DSPySummarization,
-            EngineType.instructor: InstructorSummarization,
-            EngineType.langchain: LangChainSummarization,
-            EngineType.outlines: OutlinesSummarization,
-            EngineType.ollama: OllamaSummarization,
-        }
-
         try:
-            bridge_type = bridge_types[engine_type]
+            bridge_type = self._BRIDGE_TYPES[engine_type]
             assert not issubclass(bridge_type, GliXBridge)
 
             return bridge_type(
@@ -114,7 +129,7 @@ class Summarization(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridg
         except KeyError as err:
             raise KeyError(f"Engine type {engine_type} is not supported by {self.__class__.__name__}.") from err
 
-    @property
+    @cached_property
     def supports(self) -> set[EngineType]:
         """
         :return set[EngineType]: Supported engine types.
@@ -143,18 +158,5 @@ class Summarization(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridg
             features=features,
         )
 
-        # Fetch data used for generating dataset.
-        try:
-            data = [(doc.text, doc.results[self._task_id]) for doc in docs]
-        except KeyError as err:
-            raise KeyError(f"Not all documents have results for this task with ID {self._task_id}") from err
-
-        def generate_data() -> Iterable[dict[str, Any]]:
-            """Yields results as dicts.
-            :return: Results as dicts.
-            """
-            for text, summary in data:
-                yield {"text": text, "summary": summary}
-
         # Create dataset.
-        return datasets.Dataset.from_generator(generate_data, features=features, info=info)
+        return self._results_to_dataset(docs, "summary", features, info)
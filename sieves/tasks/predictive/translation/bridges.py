@@ -1,14 +1,17 @@
 import abc
+import operator
 from collections.abc import Iterable
 from functools import cached_property
 from typing import Any, TypeVar
 
 import dspy
-import jinja2
+import numpy as np
+import numpy.typing as npt
 import pydantic
 
 from sieves.data import Doc
 from sieves.engines import EngineInferenceMode, dspy_, instructor_, langchain_, ollama_, outlines_
+from sieves.engines.core import compile_template
 from sieves.tasks.predictive.bridges import Bridge
 
 _BridgePromptSignature = TypeVar("_BridgePromptSignature")
@@ -63,7 +66,7 @@ class DSPyTranslation(TranslationBridge[dspy_.PromptSignature, dspy_.Result, dsp
             target_language: str = dspy.InputField()
             translation: str = dspy.OutputField()
 
-        Translation.__doc__ = jinja2.Template(self.prompt_signature_description).render()
+        Translation.__doc__ = compile_template(self.prompt_signature_description).render()
 
         return Translation
 
@@ -81,15 +84,13 @@ class DSPyTranslation(TranslationBridge[dspy_.PromptSignature, dspy_.Result, dsp
         return docs
 
     def consolidate(
-        self, results: Iterable[dspy_.Result], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[dspy_.Result], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[dspy_.Result]:
-        results = list(results)
-
         # Merge all chunk translations.
-        for doc_offset in docs_offsets:
+        for doc_results in self._results_per_doc(results, docs_offsets):
             translations: list[str] = []
 
-            for res in results[doc_offset[0] : doc_offset[1]]:
+            for res in doc_results:
                 if res is None:
                     continue
                 translations.append(res.translation)
@@ -136,29 +137,27 @@ class PydanticBasedTranslation(
             translation: str
 
         if self.prompt_signature_description:
-            Translation.__doc__ = jinja2.Template(self.prompt_signature_description).render()
+            Translation.__doc__ = compile_template(self.prompt_signature_description).render()
 
         return Translation
 
     def integrate(self, results: Iterable[pydantic.BaseModel], docs: Iterable[Doc]) -> Iterable[Doc]:
-        for doc, result in zip(docs, results):
-            assert hasattr(result, "translation")
-            doc.results[self._task_id] = result.translation
+        task_id = self._task_id
+        for doc, translation in zip(docs, map(operator.attrgetter("translation"), results)):
+            doc.results[task_id] = translation
 
             if self._overwrite:
-                doc.text = result.translation
+                doc.text = translation
         return docs
 
     def consolidate(
-        self, results: Iterable[pydantic.BaseModel], docs_offsets: list[tuple[int, int]]
+        self, results: Iterable[pydantic.BaseModel], docs_offsets: npt.NDArray[np.int32]
     ) -> Iterable[pydantic.BaseModel]:
-        results = list(results)
-
         # Determine label scores for chunks per document.
-        for doc_offset in docs_offsets:
+        for doc_results in self._results_per_doc(results, docs_offsets):
             translations: list[str] = []
 
-            for res in results[doc_offset[0] : doc_offset[1]]:
+            for res in doc_results:
                 if res:
                     assert hasattr(res, "translation")
                     translations.append(res.translation)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import Any, TypeAlias
+from functools import cached_property
+from typing import Any, ClassVar, TypeAlias
 
 import datasets
 import pydantic
 
+from sieves.cache import ResultCache
 from sieves.data import Doc
 from sieves.engines import Engine, EngineType, dspy_, ollama_, outlines_
 from sieves.engines.core import EngineInferenceMode, EngineModel, EnginePromptSignature, EngineResult
@@ -33,6 +35,15 @@ class FewshotExample(pydantic.BaseModel):
 
 
 class Translation(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge]):
+    # Bridge types per supported engine type.
+    _BRIDGE_TYPES: ClassVar[dict[EngineType, type[_TaskBridge]]] = {
+        EngineType.dspy: DSPyTranslation,
+        EngineType.instructor: InstructorTranslation,
+        EngineType.langchain: LangChainTranslation,
+        EngineType.outlines: OutlinesTranslation,
+        EngineType.ollama: OllamaTranslation,
+    }
+
     def __init__(
         self,
         to: str,
@@ -44,6 +55,9 @@ class Translation(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge]
         prompt_template: str | None = None,
         prompt_signature_desc: str | None = None,
         fewshot_examples: Iterable[FewshotExample] = (),
+        enable_chunk_cache: bool = True,
+        cache: ResultCache | None = None,
+        batch_size: int = 256,
     ) -> None:
         """
         Initializes new PredictiveTask.
@@ -57,6 +71,11 @@ class Translation(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge]
         :param prompt_template: Custom prompt template. If None, task's default template is being used.
         :param prompt_signature_desc: Custom prompt signature description. If None, default will be used.
         :param fewshot_examples: Few-shot examples.
+        :param enable_chunk_cache: Whether to run inference only once for identical chunks. Disable if the engine
+            should produce independent results for identical chunks.
+        :param cache: Persistent cache for chunk results. If set, results are reused across runs and only chunks
+            without cached results are run through the engine.
+        :param batch_size: Number of documents processed at once. -1 will process all documents in one go.
         """
         self._to = to
 
@@ -69,6 +88,9 @@ class Translation(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge]
             prompt_template=prompt_template,
             prompt_signature_desc=prompt_signature_desc,
             fewshot_examples=fewshot_examples,
+            enable_chunk_cache=enable_chunk_cache,
+            cache=cache,
+            batch_size=batch_size,
         )
 
     def _init_bridge(self, engine_type: EngineType) -> _TaskBridge:
@@ -77,16 +99,8 @@ class Translation(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge]
         :return _TaskBridge: Engine task bridge.
         :raises ValueError: If engine type is not supported.
         """
-        bridge_types: dict[EngineType, type[_TaskBridge]] = {
-            EngineType.dspy: DSPyTranslation,
-            EngineType.instructor: InstructorTranslation,
-            EngineType.langchain: LangChainTranslation,
-            EngineType.outlines: OutlinesTranslation,
-            EngineType.ollama: OllamaTranslation,
-        }
-
         try:
-            bridge = bridge_types[engine_type](
+            bridge = self._BRIDGE_TYPES[engine_type](
                 task_id=self._task_id,
                 prompt_template=self._custom_prompt_template,
                 prompt_signature_desc=self._custom_prompt_signature_desc,
@@ -98,7 +112,7 @@ class Translation(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge]
 
         return bridge
 
-    @property
+    @cached_property
     def supports(self) -> set[EngineType]:
         """
         :return set[EngineType]: Supported engine types.
@@ -128,18 +142,5 @@ class Translation(PredictiveTask[_TaskPromptSignature, _TaskResult, _TaskBridge]
             features=features,
         )
 
-        # Fetch data used for generating dataset.
-        try:
-            data = [(doc.text, doc.results[self._task_id]) for doc in docs]
-        except KeyError as err:
-            raise KeyError(f"Not all documents have results for this task with ID {self._task_id}") from err
-
-        def generate_data() -> Iterable[dict[str, Any]]:
-            """Yields results as dicts.
-            :return: Results as dicts.
-            """
-            for text, translation in data:
-                yield {"text": text, "translation": translation}
-
         # Create dataset.
-        return datasets.Dataset.from_generator(generate_data, features=features, info=info)
+        return self._results_to_dataset(docs, "translation", features, info)
@@ -1,26 +1,81 @@
 # mypy: ignore-errors
+import functools
 import os
+from pathlib import Path
 
 import anthropic
 import dspy
 import gliner.multitask
+import huggingface_hub
 import instructor
 import langchain_anthropic
 import outlines
 import pytest
 import tokenizers
 import transformers
+from huggingface_hub.utils import LocalEntryNotFoundError
 
 from sieves import Doc, engines
 
 
+@functools.cache
+def _snapshot(repo_id: str, allow_patterns: tuple[str, ...] | None = None) -> Path:
+    """Fetches local snapshot of model repository. Uses locally cached snapshot if available, so that subsequent test
+    runs don't hit the Hugging Face Hub. Models are loaded from the snapshot directory, which doesn't require any
+    network access either.
+    :param repo_id: Repository ID.
+    :param allow_patterns: Patterns of files to fetch. If None, all files (except weights in other frameworks' formats)
+        are fetched.
+    :returns Path: Path to local snapshot directory.
+    """
+    kwargs = {
+        "repo_id": repo_id,
+        "allow_patterns": list(allow_patterns) if allow_patterns else None,
+        "ignore_patterns": ["*.h5", "*.msgpack", "*.onnx", "*.ot", "*.tflite"],
+    }
+    try:
+        return Path(huggingface_hub.snapshot_download(**kwargs, local_files_only=True))
+    except LocalEntryNotFoundError:
+        return Path(huggingface_hub.snapshot_download(**kwargs))
+
+
 @pytest.fixture(scope="session")
 def tokenizer() -> tokenizers.Tokenizer:
-    return tokenizers.Tokenizer.from_pretrained("gpt2")
+    return tokenizers.Tokenizer.from_file(str(_snapshot("gpt2", allow_patterns=("tokenizer.json",)) / "tokenizer.json"))
 
 
+@functools.cache
+def _load_gliner_model(model_id: str) -> gliner.GLiNER:
+    """Loads GliNER model. Cached, so that model weights are loaded only once per session.
+    :param model_id: Model ID.
+    :returns gliner.GLiNER: Loaded model.
+    """
+    return gliner.GLiNER.from_pretrained(str(_snapshot(model_id)))
+
+
+@functools.cache
+def _load_hf_zeroshot_pipeline(model_id: str) -> transformers.Pipeline:
+    """Loads Hugging Face zero-shot classification pipeline. Cached, so that model weights are loaded only once per
+    session.
+    :param model_id: Model ID.
+    :returns transformers.Pipeline: Loaded pipeline.
+    """
+    return transformers.pipeline("zero-shot-classification", model=str(_snapshot(model_id)))
+
+
+@functools.cache
+def _load_outlines_model(model_id: str) -> outlines.models.Transformers:
+    """Loads Outlines model. Cached, so that model weights are loaded only once per session.
+    :param model_id: Model ID.
+    :returns outlines.models.Transformers: Loaded model.
+    """
+    return outlines.models.transformers(str(_snapshot(model_id)))
+
+
+@functools.cache
 def _make_engine(engine_type: engines.EngineType, batch_size: int):
-    """Create engine.
+    """Create engine. Cached, so that engines are created only once per session - session-scoped parametrized fixtures
+    are otherwise recreated whenever the parameter changes between tests.
     :param engine_type: Engine type.
     :param batch_size: Batch size to use in engine.
     :returns Engine: Enstantiated engine.
@@ -34,7 +89,7 @@ def _make_engine(engine_type: engines.EngineType, batch_size: int):
         case engines.EngineType.glix:
             model_id = "knowledgator/gliner-multitask-v1.0"
             return engines.glix_.GliX(
-                model=gliner.GLiNER.from_pretrained(model_id),
+                model=_load_gliner_model(model_id),
                 batch_size=batch_size,
             )
 
@@ -52,9 +107,7 @@ def _make_engine(engine_type: engines.EngineType, batch_size: int):
             return engines.instructor_.Instructor(model=model, batch_size=batch_size)
 
         case engines.EngineType.huggingface:
-            model = transformers.pipeline(
-                "zero-shot-classification", model="MoritzLaurer/xtremedistil-l6-h256-zeroshot-v1.1-all-33"
-            )
+            model = _load_hf_zeroshot_pipeline("MoritzLaurer/xtremedistil-l6-h256-zeroshot-v1.1-all-33")
             return engines.huggingface_.HuggingFace(model=model, batch_size=batch_size)
 
         case engines.EngineType.ollama:
@@ -63,7 +116,7 @@ def _make_engine(engine_type: engines.EngineType, batch_size: int):
 
         case engines.EngineType.outlines:
             model_name = "HuggingFaceTB/SmolLM-135M-Instruct"
-            return engines.outlines_.Outlines(model=outlines.models.transformers(model_name), batch_size=batch_size)
+            return engines.outlines_.Outlines(model=_load_outlines_model(model_name), batch_size=batch_size)
 
 
 @pytest.fixture(scope="session")
@@ -89,6 +89,9 @@ def test_serialization(dummy_docs, batch_engine) -> None:
             "value": [
                 {
                     "cls_name": "sieves.tasks.predictive.classification.core.Classification",
+                    "batch_size": {"is_placeholder": False, "value": 256},
+                    "cache": {"is_placeholder": False, "value": None},
+                    "enable_chunk_cache": {"is_placeholder": False, "value": True},
                     "engine": {
                         "is_placeholder": False,
                         "value": {
@@ -69,6 +69,9 @@ def test_serialization(pii_masking_docs, batch_engine) -> None:
             "value": [
                 {
                     "cls_name": "sieves.tasks.predictive.pii_masking.core.PIIMasking",
+                    "batch_size": {"is_placeholder": False, "value": 256},
+                    "cache": {"is_placeholder": False, "value": None},
+                    "enable_chunk_cache": {"is_placeholder": False, "value": True},
                     "engine": {
                         "is_placeholder": False,
                         "value": {
@@ -0,0 +1,85 @@
+# mypy: ignore-errors
+import datasets
+import numpy as np
+import pytest
+
+from sieves import Doc
+from sieves.engines import Outlines
+from sieves.tasks import PredictiveTask
+from sieves.tasks.predictive import question_answering
+from sieves.tasks.predictive.bridges import Bridge
+
+
+def test_execute_unique():
+    """Tests that identical chunks are run through the executable only once and their results are fanned out."""
+    executed: list[str] = []
+
+    def executable(values):
+        for chunk_values in values:
+            executed.append(chunk_values["text"])
+            yield chunk_values["text"].upper()
+
+    texts = ["a", "b", "a", "c", "b", "a"]
+    keys = list(PredictiveTask._chunk_keys({"question": "?"}, texts))
+    results = list(PredictiveTask._execute_unique(executable, ({"text": text} for text in texts), keys))
+
+    assert executed == ["a", "b", "c"]
+    assert results == ["A", "B", "A", "C", "B", "A"]
+
+    # Identical chunk texts with different document values mustn't share results.
+    assert list(PredictiveTask._chunk_keys({"question": "?"}, ["a"])) != list(
+        PredictiveTask._chunk_keys({"question": "!"}, ["a"])
+    )
+
+
+def test_results_per_doc():
+    """Tests that chunk results are grouped by document according to the chunk offsets."""
+    docs_offsets = np.array([[0, 2], [2, 3], [3, 6]], dtype=np.int32)
+    results = Bridge._results_per_doc(iter(["a", "b", "c", "d", "e", "f"]), docs_offsets)
+
+    assert list(results) == [["a", "b"], ["c"], ["d", "e", "f"]]
+
+
+def test_check_n_results():
+    """Tests that executables producing fewer or more results than prompts are detected."""
+    assert list(PredictiveTask._check_n_results(iter(["a", None, "c"]), 3)) == ["a", None, "c"]
+
+    with pytest.raises(AssertionError, match="2 results instead of 3"):
+        list(PredictiveTask._check_n_results(iter(["a", "b"]), 3))
+
+    # Surplus results have to be detected even if consumers stop pulling after the expected number of results.
+    results = PredictiveTask._check_n_results(iter(["a", "b", "c", "d"]), 3)
+    with pytest.raises(AssertionError, match="more than 3 results"):
+        [next(results) for _ in range(3)]
+
+    # Missing results of deduplicated chunks are detected too.
+    keys = list(PredictiveTask._chunk_keys({}, ["a", "b", "a"]))
+    with pytest.raises(AssertionError):
+        list(
+            PredictiveTask._execute_unique(
+                lambda values: [v["text"] for v in values][:1], ({"text": t} for t in "aba"), keys
+            )
+        )
+
+
+def test_results_to_dataset(monkeypatch):
+    """Tests that datasets are assembled from multiple Arrow record batches in document order."""
+    # No inference is run, so the engine doesn't need an actual model.
+    engine = Outlines(model=object())
+    task = question_answering.QuestionAnswering(task_id="qa", questions=["What is this about?"], engine=engine)
+    monkeypatch.setattr(task, "_DATASET_BATCH_SIZE", 2)
+    docs = [Doc(text=f"Text {i}.") for i in range(5)]
+    for i, doc in enumerate(docs):
+        doc.results["qa"] = [f"Answer {i}."]
+
+    features = datasets.Features(
+        {"text": datasets.Value("string"), "answers": datasets.Sequence(datasets.Value("string"))}
+    )
+    info = datasets.DatasetInfo(features=features)
+    dataset = task._results_to_dataset(iter(docs), "answers", features, info)
+
+    assert dataset.features == features
+    assert list(dataset) == [{"text": f"Text {i}.", "answers": [f"Answer {i}."]} for i in range(5)]
+
+    with pytest.raises(KeyError):
+        task._results_to_dataset([*docs, Doc(text="This is a dummy text.")], "answers", features, info)
@@ -1,8 +1,9 @@
 # mypy: ignore-errors
+import numpy as np
 import pytest
 
 from sieves import Doc, Pipeline
-from sieves.engines import EngineType
+from sieves.engines import EngineType, GliX
 from sieves.tasks import PredictiveTask
 from sieves.tasks.predictive import question_answering
 
@@ -67,7 +68,7 @@ def test_run(qa_docs, batch_engine, fewshot):
         assert "qa" in doc.results
 
 
-@pytest.mark.parametrize("batch_engine", [EngineType.outlines], indirect=["batch_engine"])
+@pytest.mark.parametrize("batch_engine", [EngineType.glix, EngineType.outlines], indirect=["batch_engine"])
 def test_to_dataset(qa_docs, batch_engine) -> None:
     task = question_answering.QuestionAnswering(
         task_id="qa",
@@ -115,6 +116,9 @@ def test_serialization(qa_docs, batch_engine) -> None:
             "value": [
                 {
                     "cls_name": "sieves.tasks.predictive.question_answering.core.QuestionAnswering",
+                    "batch_size": {"is_placeholder": False, "value": 256},
+                    "cache": {"is_placeholder": False, "value": None},
+                    "enable_chunk_cache": {"is_placeholder": False, "value": True},
                     "engine": {
                         "is_placeholder": False,
                         "value": {
@@ -146,3 +150,50 @@ def test_serialization(qa_docs, batch_engine) -> None:
     }
 
     Pipeline.deserialize(config=config, tasks_kwargs=[{"engine": {"model": batch_engine.model}}])
+
+
+@pytest.mark.parametrize("batch_engine", [EngineType.glix], indirect=["batch_engine"])
+def test_run_glix(qa_docs, batch_engine) -> None:
+    """Tests that GliX runs all text-question prompts with the installed GliNER version."""
+    questions = [
+        "What branch of science is this text describing?",
+        "What the goal of the science as described in the text?",
+    ]
+    task = question_answering.QuestionAnswering(task_id="qa", questions=questions, engine=batch_engine)
+    results = list(task._executable([{"text": doc.text} for doc in qa_docs]))
+
+    # One list of answers per question and text.
+    assert len(results) == len(qa_docs)
+    for result in results:
+        assert len(result) == len(questions)
+        for answers in result:
+            assert all(isinstance(answer["answer"], str) and isinstance(answer["score"], float) for answer in answers)
+
+    docs = list(task(qa_docs))
+    for doc in docs:
+        assert len(doc.results["qa"]) == len(questions)
+        assert all(isinstance(answer, str) for answer in doc.results["qa"])
+
+
+def test_glix_results_to_dataset() -> None:
+    """Tests that GliX answers are consolidated per question and converted into a dataset."""
+    task = question_answering.QuestionAnswering(
+        task_id="qa", questions=["Question 1?", "Question 2?"], engine=GliX(model=object())
+    )
+    # Two chunks for the first document, one chunk without any answers for the second.
+    chunk_results = [
+        [[{"answer": "a", "score": 0.6}], []],
+        [[{"answer": "b", "score": 0.9}], [{"answer": "c", "score": 0.5}]],
+        [[], []],
+    ]
+    docs_offsets = np.array([[0, 2], [2, 3]], dtype=np.int32)
+    docs = [Doc(text="First text."), Doc(text="Second text.")]
+
+    docs = list(task._bridge.integrate(task._bridge.consolidate(chunk_results, docs_offsets), docs))
+    assert [doc.results["qa"] for doc in docs] == [["b", "c"], ["", ""]]
+
+    dataset = task.to_dataset(docs)
+    assert list(dataset) == [
+        {"text": "First text.", "answers": ["b", "c"]},
+        {"text": "Second text.", "answers": ["", ""]},
+    ]
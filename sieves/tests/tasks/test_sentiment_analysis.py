@@ -88,6 +88,9 @@ def test_serialization(dummy_docs, batch_engine) -> None:
                 {
                     "aspects": {"is_placeholder": False, "value": ("food", "overall", "service")},
                     "cls_name": "sieves.tasks.predictive.sentiment_analysis.core.SentimentAnalysis",
+                    "batch_size": {"is_placeholder": False, "value": 256},
+                    "cache": {"is_placeholder": False, "value": None},
+                    "enable_chunk_cache": {"is_placeholder": False, "value": True},
                     "engine": {
                         "is_placeholder": False,
                         "value": {
@@ -1,10 +1,12 @@
 # mypy: ignore-errors
+import numpy as np
 import pytest
 
 from sieves import Doc, Pipeline
 from sieves.engines import EngineType
 from sieves.tasks import PredictiveTask
 from sieves.tasks.predictive import summarization
+from sieves.tasks.predictive.summarization.bridges import OutlinesSummarization
 
 
 @pytest.mark.parametrize(
@@ -81,6 +83,9 @@ def test_serialization(summarization_docs, batch_engine) -> None:
             "value": [
                 {
                     "cls_name": "sieves.tasks.predictive.summarization.core.Summarization",
+                    "batch_size": {"is_placeholder": False, "value": 256},
+                    "cache": {"is_placeholder": False, "value": None},
+                    "enable_chunk_cache": {"is_placeholder": False, "value": True},
                     "engine": {
                         "is_placeholder": False,
                         "value": {
@@ -106,3 +111,19 @@ def test_serialization(summarization_docs, batch_engine) -> None:
     }
 
     Pipeline.deserialize(config=config, tasks_kwargs=[{"engine": {"model": batch_engine.model}}])
+
+
+def test_consolidate():
+    """Tests that single-chunk results are passed through and multi-chunk summaries are merged."""
+    bridge = OutlinesSummarization(
+        task_id="summarizer", prompt_template=None, prompt_signature_desc=None, overwrite=False, n_words=10
+    )
+    signature = bridge.prompt_signature
+    results = [signature(summary="A."), signature(summary=" B. "), signature(summary="C."), signature(summary="D.")]
+    docs_offsets = np.array([[0, 1], [1, 2], [2, 4]], dtype=np.int32)
+
+    consolidated = list(bridge.consolidate(results, docs_offsets))
+
+    assert consolidated[0] is results[0]
+    assert consolidated[1].summary == "B."
+    assert consolidated[2].summary == "C.\nD."
@@ -0,0 +1,52 @@
+# mypy: ignore-errors
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from sieves import Doc, Pipeline
+from sieves.cache import ResultCache
+from sieves.engines import EngineType
+from sieves.tasks.predictive import classification
+
+
+@pytest.mark.parametrize(
+    "batch_engine",
+    [EngineType.dspy, EngineType.huggingface, EngineType.outlines],
+    indirect=["batch_engine"],
+)
+def test_result_cache(dummy_docs, batch_engine):
+    """Tests that cached results are reused across runs without running inference again."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = ResultCache(Path(tmp_dir) / "cache.db", model_id="test")
+
+        def run() -> tuple[list[Doc], int]:
+            task = classification.Classification(
+                task_id="classifier", labels=["science", "politics"], engine=batch_engine, cache=cache
+            )
+            # Count prompts passed to the engine.
+            executable = task._executable
+            n_prompts = 0
+
+            def counting_executable(values):
+                nonlocal n_prompts
+                values = list(values)
+                n_prompts += len(values)
+                return executable(values)
+
+            task._executable = counting_executable
+            docs = list(Pipeline([task])([Doc(text=doc.text) for doc in dummy_docs]))
+            return docs, n_prompts
+
+        docs, n_prompts = run()
+        assert n_prompts > 0
+        n_cached = len(cache)
+        assert 0 < n_cached <= len(dummy_docs)
+
+        # Second run is served from the cache: the engine must not be called, and results have to be identical.
+        cached_docs, n_cached_prompts = run()
+        assert n_cached_prompts == 0
+        assert len(cache) == n_cached
+        assert [doc.results["classifier"] for doc in docs] == [doc.results["classifier"] for doc in cached_docs]
+
+        cache.close()
@@ -0,0 +1,60 @@
+# mypy: ignore-errors
+import pytest
+
+from sieves.engines import glix_
+
+
+class _StubGliNER:
+    """Stand-in for GliNER model recording calls to compile its underlying torch module."""
+
+    class _Module:
+        def __init__(self):
+            self.compile_kwargs: list[dict] = []
+
+        def compile(self, **kwargs):
+            self.compile_kwargs.append(kwargs)
+
+    def __init__(self):
+        self.model = self._Module()
+
+
+@pytest.mark.parametrize("compile_model", [True, False])
+def test_glix_compile_model(compile_model):
+    """Tests that GliX compiles its model only if requested, and that this setting survives serialization."""
+    model = _StubGliNER()
+    engine = glix_.GliX(model=model, compile_model=compile_model)
+    assert model.model.compile_kwargs == ([{"dynamic": True}] if compile_model else [])
+
+    config = engine.serialize()
+    assert config.model_dump()["compile_model"] == {"is_placeholder": False, "value": compile_model}
+
+    restored_model = _StubGliNER()
+    glix_.GliX.deserialize(config, model=restored_model)
+    assert restored_model.model.compile_kwargs == ([{"dynamic": True}] if compile_model else [])
+
+
+class _StubQAGliNER:
+    """Stand-in for GliNER model that only provides `inference()`, like e.g. gliner 0.2.29. Answers every prompt with
+    the text it was asked about, scored depending on the question."""
+
+    def to(self, device):
+        return self
+
+    def inference(self, texts, labels, **kwargs):
+        return [[{"text": text.split("\n")[-1].strip(), "score": 0.5 if "first" in text else 0.9}] for text in texts]
+
+
+def test_glix_question_answering():
+    """Tests that GliX asks every question for every text and returns one list of answers per question."""
+    engine = glix_.GliX(model=_StubQAGliNER(), batch_size=2)
+    questions = ["What's the first question?", "What's the second question?"]
+    executable = engine.build_executable(
+        inference_mode=glix_.InferenceMode.question_answering, prompt_template=None, prompt_signature=questions
+    )
+
+    results = list(executable([{"text": "Text A."}, {"text": "Text B."}, {"text": "Text C."}]))
+
+    assert results == [
+        [[{"answer": text, "score": 0.5}], [{"answer": text, "score": 0.9}]]
+        for text in ("Text A.", "Text B.", "Text C.")
+    ]
@@ -1,4 +1,5 @@
 # mypy: ignore-errors
+import asyncio
 from collections.abc import Iterable
 
 import pytest
@@ -38,3 +39,26 @@ def test_double_task(dummy_docs, batch_engine) -> None:
         assert doc.results["task_2"]
         assert "task_1" in doc.results
         assert "task_2" in doc.results
+
+
+@pytest.mark.parametrize("concurrent", [True, False])
+def test_acall(dummy_docs, concurrent) -> None:
+    class DummyTask(tasks.Task):
+        def __call__(self, _docs: Iterable[Doc]) -> Iterable[Doc]:
+            _docs = list(_docs)
+            for _doc in _docs:
+                _doc.results[self._task_id] = "dummy"
+            return _docs
+
+    pipe = Pipeline(
+        [
+            DummyTask(task_id="task_1", show_progress=False, include_meta=False),
+            DummyTask(task_id="task_2", show_progress=False, include_meta=False),
+        ]
+    )
+    docs = asyncio.run(pipe.acall(dummy_docs, concurrent=concurrent))
+
+    assert len(docs) == 2
+    for doc in docs:
+        assert doc.results["task_1"] == "dummy"
+        assert doc.results["task_2"] == "dummy"
@@ -48,6 +48,9 @@ def test_serialization_pipeline(dummy_docs, batch_engine, tokenizer):
                 },
                 {
                     "cls_name": "sieves.tasks.predictive.classification.core.Classification",
+                    "batch_size": {"is_placeholder": False, "value": 256},
+                    "cache": {"is_placeholder": False, "value": None},
+                    "enable_chunk_cache": {"is_placeholder": False, "value": True},
                     "engine": {
                         "is_placeholder": False,
                         "value": {